@@ -7,38 +7,147 @@ This module loads configuration from the config file or environment variables.
 
 import os
 import json
-from pathlib import Path
+import logging
+import threading
+from typing import NamedTuple
+
+# Prefer orjson for parsing when it is installed; fall back to stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_log = logging.getLogger(__name__)
+
+# Keys recognised in the config file; anything else is ignored
+_CONFIG_KEYS = frozenset(("whisper_path", "model_path"))
+
+# User config file; expanduser() returns the path unchanged when no home
+# directory can be determined (e.g. $HOME unset in a container)
+_USER_CONFIG_PATH = os.path.expanduser("~/.config/ytscript/config.json")
+
+# Config file locations to check (in order of preference)
+_CONFIG_PATHS = tuple(
+    path for path in (
+        "./config.json",  # Current directory
+        _USER_CONFIG_PATH,  # User config directory
+    )
+    if not path.startswith("~")
+)
+
+
+class Config(NamedTuple):
+    """Resolved YTScript configuration."""
+    whisper_path: str
+    model_path: str
+
+
+def _resolve_path(path):
+    """Expand ~ and make a configured path absolute."""
+    return os.path.abspath(os.path.expanduser(path))
+
+
+# Configuration used when neither a config file nor environment overrides exist
+_DEFAULT_CONFIG = Config(
+    whisper_path=_resolve_path("./whisper.cpp"),
+    model_path=_resolve_path("./models/ggml-base.en.bin"),
+)
+
+
+# Cached result of _read_config(), guarded by _config_lock
+_config = None
+_config_lock = threading.Lock()
 
 
 def load_config():
     """
     Load configuration from the config file or environment variables.
     
+    The result is cached for the lifetime of the process; call
+    reload_config() to pick up changes written to the config file.
+    Concurrent first calls from several threads read the file only once.
+    
     Returns:
-        dict: Configuration dictionary with whisper_path and model_path
+        Config: Named tuple with whisper_path and model_path
     """
-    # Default configuration
-    config = {
-        "whisper_path": os.environ.get("WHISPER_CPP_PATH", "./whisper.cpp"),
-        "model_path": os.environ.get("WHISPER_MODEL_PATH", "./models/ggml-base.en.bin"),
-    }
-    
-    # Config file locations to check (in order of preference)
-    config_paths = [
-        Path("./config.json"),  # Current directory
-        Path(os.path.expanduser("~/.config/ytscript/config.json")),  # User config directory
-    ]
+    global _config
+    
+    config = _config
+    if config is not None:
+        return config
+    
+    with _config_lock:
+        if _config is None:
+            _config = _read_config()
+        return _config
+
+
+def reload_config():
+    """
+    Discard the cached configuration and load it again.
+    
+    Returns:
+        Config: Freshly loaded configuration
+    """
+    global _config
+    
+    with _config_lock:
+        _config = _read_config()
+        return _config
+
+
+def _read_config():
+    """
+    Read the configuration from disk and the environment.
+    
+    Paths are expanded and made absolute here so callers do not need to
+    resolve them again.
+    
+    Returns:
+        Config: Named tuple with whisper_path and model_path
+    """
+    config = {}
     
     # Try to load configuration from file
-    for config_path in config_paths:
-        if config_path.exists():
-            try:
-                with open(config_path, "r") as f:
-                    file_config = json.load(f)
-                    # Update config with values from file
-                    config.update(file_config)
-                break
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Failed to load config from {config_path}: {e}")
-    
-    return config
+    for config_path in _CONFIG_PATHS:
+        # Open directly rather than probing with exists() first
+        try:
+            with open(config_path, "rb") as f:
+                data = f.read()
+            
+            # An empty or whitespace-only file cannot hold any settings
+            if not data.strip():
+                _log.warning("Ignoring empty config file %s", config_path)
+                continue
+            
+            file_config = _json_loads(data)
+        except FileNotFoundError:
+            continue
+        except (ValueError, IOError) as e:
+            _log.warning("Failed to load config from %s: %s", config_path, e)
+            continue
+        
+        # Update config with the known values from file
+        config.update((k, v) for k, v in file_config.items() if k in _CONFIG_KEYS)
+        break
+    
+    # Fall back to environment variables for keys the file did not
+    # provide, reading each variable at most once
+    whisper_path = config.get("whisper_path")
+    if whisper_path is None:
+        whisper_path = os.environ.get("WHISPER_CPP_PATH")
+    model_path = config.get("model_path")
+    if model_path is None:
+        model_path = os.environ.get("WHISPER_MODEL_PATH")
+    
+    # Nothing to override: hand back the shared default instance
+    if whisper_path is None and model_path is None:
+        return _DEFAULT_CONFIG
+    
+    return Config(
+        whisper_path=(_DEFAULT_CONFIG.whisper_path if whisper_path is None
+                      else _resolve_path(whisper_path)),
+        model_path=(_DEFAULT_CONFIG.model_path if model_path is None
+                    else _resolve_path(model_path)),
+    )
@@ -10,67 +10,310 @@ This module provides a GUI for the YTScript tool, making it easier to:
 
 import os
 import sys
+import io
+import contextlib
 import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext, messagebox
 import threading
 import queue
+import collections
+import itertools
+import functools
 import subprocess
+import concurrent.futures
+import importlib.util
 from pathlib import Path
 import re
-import time
 import json
+import difflib
 from datetime import datetime
-import shutil
-import webbrowser
 
 # Import local modules
 try:
-    from config import load_config
-    from yt_script import YTScript
-    try:
-        from summarizer import get_available_models, LocalSummarizer
-        SUMMARIZER_AVAILABLE = True
-    except ImportError:
-        SUMMARIZER_AVAILABLE = False
+    from config import load_config, reload_config
+    from yt_script import YTScript, OperationCancelled, stop_process
 except ImportError:
     messagebox.showerror("Error", "Could not import YTScript modules. Make sure you're running from the correct directory.")
     sys.exit(1)
 
+# The summarizer is only imported when it is actually used
+SUMMARIZER_AVAILABLE = importlib.util.find_spec("summarizer") is not None
+
+# Pattern for recognising YouTube video URLs (pasted or dropped)
+YOUTUBE_URL_RE = re.compile(
+    r"(?:https?://)?(?:www\.|m\.)?youtu(?:\.be/|be\.com/(?:watch\?(?:.*&)?v=|embed/|v/|shorts/))"
+    r"([\w\-]+)(?:[?&]t=\d+)?(?:[?&]list=[\w\-]+)?"
+)
+
+# Directory holding the config file, GUI preferences and history
+CONFIG_DIR = Path(os.path.expanduser("~/.config/ytscript"))
+
+# GUI preferences (theme and last output directory) saved in one file
+SETTINGS_FILE = CONFIG_DIR / "settings.json"
+
+# Delay before preference and history changes are written to disk (milliseconds)
+SETTINGS_SAVE_DELAY = 500
+
+# Maximum number of entries kept in the transcription history
+MAX_HISTORY = 100
+
+# Commands used to report the versions of external tools
+TOOL_VERSION_COMMANDS = {
+    "yt-dlp": ["yt-dlp", "--version"],
+    "ffmpeg": ["ffmpeg", "-version"],
+}
+
+# Colors for each theme: window and console colors plus ttk style options
+THEME_PALETTES = {
+    "light": {
+        "window": "#f0f0f0",
+        "console": {"background": "#f5f5f5", "foreground": "#000000"},
+        "styles": {
+            ".": {"background": "#f0f0f0", "foreground": "#000000", "fieldbackground": "#ffffff"},
+            "TLabel": {"background": "#f0f0f0", "foreground": "#000000"},
+            "TFrame": {"background": "#f0f0f0"},
+            "TButton": {"background": "#e1e1e1", "foreground": "#000000"},
+            "TNotebook": {"background": "#f0f0f0", "tabmargins": [2, 5, 2, 0]},
+            "TNotebook.Tab": {"background": "#e1e1e1", "foreground": "#000000", "padding": [10, 2]},
+            "Accent.TButton": {"background": "#007bff", "foreground": "#ffffff"},
+        },
+        "maps": {
+            "TNotebook.Tab": {
+                "background": [("selected", "#f8f8f8")],
+                "foreground": [("selected", "#000000")],
+            },
+        },
+    },
+    "dark": {
+        "window": "#2d2d2d",
+        "console": {"background": "#3d3d3d", "foreground": "#ffffff"},
+        "styles": {
+            ".": {"background": "#2d2d2d", "foreground": "#ffffff", "fieldbackground": "#3d3d3d"},
+            "TLabel": {"background": "#2d2d2d", "foreground": "#ffffff"},
+            "TFrame": {"background": "#2d2d2d"},
+            "TButton": {"background": "#3d3d3d", "foreground": "#ffffff"},
+            "TNotebook": {"background": "#2d2d2d", "tabmargins": [2, 5, 2, 0]},
+            "TNotebook.Tab": {"background": "#3d3d3d", "foreground": "#ffffff", "padding": [10, 2]},
+            "Accent.TButton": {"background": "#007bff", "foreground": "#ffffff"},
+        },
+        "maps": {
+            "TNotebook.Tab": {
+                "background": [("selected", "#4d4d4d")],
+                "foreground": [("selected", "#ffffff")],
+            },
+        },
+    },
+}
+
+# Application icon, decoded once and shared by all windows
+_APP_ICON = None
+
+
+def _load_app_icon():
+    """
+    Load the application icon, preferring the pre-rasterized PNG.
+    
+    Tk 8.6 cannot decode SVG, so icon.svg is only tried as a fallback
+    for Tk builds that support it.
+    
+    Returns:
+        tk.PhotoImage, or None if no icon could be loaded
+    """
+    global _APP_ICON
+    
+    if _APP_ICON is None:
+        icon_dir = Path(__file__).parent
+        for name in ("icon.png", "icon.svg"):
+            try:
+                _APP_ICON = tk.PhotoImage(file=str(icon_dir / name))
+                break
+            except tk.TclError:
+                continue  # Missing file or unsupported format
+    
+    return _APP_ICON
+
+
+def _probe_tool_version(command):
+    """
+    Run a tool's version command.
+    
+    Args:
+        command: Command and arguments that print the version
+    
+    Returns:
+        First line of the tool's output, or None if it could not be run
+    """
+    try:
+        result = subprocess.run(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=5
+        )
+    except (FileNotFoundError, subprocess.SubprocessError):
+        return None
+    
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    return result.stdout.strip().splitlines()[0]
+
+
+def _spawn_detached(command):
+    """
+    Start a helper program without waiting for it to exit.
+    
+    Args:
+        command: Command and arguments to run
+    """
+    try:
+        subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+    except OSError as e:
+        messagebox.showerror("Error", f"Could not run {command[0]}: {e}")
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_tool_versions():
+    """
+    Probe all external tools concurrently.
+    
+    The result is cached for the lifetime of the process; call
+    _probe_tool_versions.cache_clear() after installing tools.
+    
+    Returns:
+        Tuple of (tool name, version or None) pairs
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(TOOL_VERSION_COMMANDS)) as executor:
+        versions = executor.map(_probe_tool_version, TOOL_VERSION_COMMANDS.values())
+        return tuple(zip(TOOL_VERSION_COMMANDS, versions))
+
+
+class ToolTip:
+    """Show a short help text while the pointer is over a widget."""
+    
+    def __init__(self, widget, text, delay=500):
+        """
+        Attach a tooltip to a widget.
+        
+        The tooltip window is only created when it is first shown.
+        
+        Args:
+            widget: Widget that shows the tooltip
+            text: Help text to show
+            delay: Hover time before the tooltip appears (milliseconds)
+        """
+        self.widget = widget
+        self.text = text
+        self.delay = delay
+        self.window = None
+        self.show_timer = None
+        
+        widget.bind("<Enter>", self.schedule, add="+")
+        widget.bind("<Leave>", self.hide, add="+")
+        widget.bind("<ButtonPress>", self.hide, add="+")
+    
+    def schedule(self, event=None):
+        """Show the tooltip after the hover delay."""
+        self.hide()
+        self.show_timer = self.widget.after(self.delay, self.show)
+    
+    def show(self):
+        """Show the tooltip below the widget."""
+        self.show_timer = None
+        x = self.widget.winfo_rootx() + 10
+        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
+        
+        self.window = tk.Toplevel(self.widget)
+        self.window.wm_overrideredirect(True)
+        self.window.wm_geometry(f"+{x}+{y}")
+        tk.Label(
+            self.window,
+            text=self.text,
+            background="#ffffe0",
+            foreground="#000000",
+            relief=tk.SOLID,
+            borderwidth=1,
+            padx=4,
+            pady=2
+        ).pack()
+    
+    def hide(self, event=None):
+        """Cancel a pending tooltip and hide a visible one."""
+        if self.show_timer is not None:
+            self.widget.after_cancel(self.show_timer)
+            self.show_timer = None
+        if self.window is not None:
+            self.window.destroy()
+            self.window = None
+
 
 class RedirectText:
     """Class to redirect stdout to a tkinter widget."""
     
-    def __init__(self, text_widget):
-        """Initialize with text widget to redirect to."""
+    def __init__(self, text_widget, max_lines=5000, interval=50):
+        """
+        Initialize with text widget to redirect to.
+        
+        Args:
+            text_widget: Text widget that receives the output
+            max_lines: Maximum number of lines kept in the widget
+            interval: Milliseconds between widget updates while redirecting
+        """
         self.text_widget = text_widget
-        self.queue = queue.Queue()
+        self.max_lines = max_lines
+        self.interval = interval
+        self.buffer = collections.deque()
         self.update_timer = None
         
     def write(self, string):
-        """Write text to the queue."""
-        self.queue.put(string)
+        """Buffer text for the next widget update (safe from any thread)."""
+        self.buffer.append(string)
         
     def flush(self):
         """Flush the stream."""
         pass
     
+    def start_updates(self):
+        """Start periodic widget updates; must be called from the Tk thread."""
+        if self.update_timer is None:
+            self.update_timer = self.text_widget.after(self.interval, self.update_widget)
+    
     def update_widget(self):
-        """Update the text widget with text from the queue."""
-        while not self.queue.empty():
-            text = self.queue.get_nowait()
+        """Update the text widget with the buffered text."""
+        # Drain everything written since the last update
+        chunks = []
+        while self.buffer:
+            chunks.append(self.buffer.popleft())
+        
+        # Insert it with a single widget update
+        if chunks:
             self.text_widget.configure(state='normal')
-            self.text_widget.insert(tk.END, text)
+            self.text_widget.insert(tk.END, "".join(chunks))
+            
+            # Drop the oldest lines so the widget does not grow without bound
+            lines = int(self.text_widget.index('end-1c').split('.')[0])
+            if lines > self.max_lines:
+                self.text_widget.delete('1.0', f'{lines - self.max_lines + 1}.0')
+            
             self.text_widget.see(tk.END)
             self.text_widget.configure(state='disabled')
         
-        # Schedule next update
-        self.update_timer = self.text_widget.after(100, self.update_widget)
+        # Keep updating while redirection is active
+        if self.update_timer is not None:
+            self.update_timer = self.text_widget.after(self.interval, self.update_widget)
     
     def stop_updates(self):
-        """Stop the periodic updates."""
+        """Stop the periodic updates and show the remaining output now."""
         if self.update_timer:
             self.text_widget.after_cancel(self.update_timer)
             self.update_timer = None
+        self.update_widget()
 
 
 class YTScriptGUI(tk.Tk):
@@ -80,24 +323,40 @@ class YTScriptGUI(tk.Tk):
         """Initialize the GUI."""
         super().__init__()
         
-        # Load config
+        # Latest progress value posted by a worker thread, applied in batches;
+        # set up before the tabs, which may already start workers
+        self._pending_progress = None
+        self._pending_status = None
+        
+        # UI callbacks posted by worker threads, run by _pump_ui on the Tk
+        # thread; the pump only runs while a worker started by _start_worker
+        # is alive or its updates are still queued
+        self.ui_queue = queue.Queue()
+        self._workers = []
+        self._pump_job = None
+        
+        # Load config and GUI preferences
         self.config = load_config()
+        self._prefs = self._load_prefs()
+        self._prefs_job = None
         
         # Set up the window
         self.title("YTScript - YouTube Transcript Generator")
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         self.geometry("950x650")
         self.minsize(800, 600)
         
         # Set application icon
-        try:
-            icon_path = Path(__file__).parent / "icon.svg"
-            if icon_path.exists():
-                self.iconphoto(True, tk.PhotoImage(file=str(icon_path)))
-        except Exception:
-            pass  # Ignore icon errors
+        icon = _load_app_icon()
+        if icon is not None:
+            self.iconphoto(True, icon)
         
         # Theme settings
-        self.theme_mode = tk.StringVar(value=self._load_theme_preference())
+        self.theme_mode = tk.StringVar(value=self._prefs["theme"])
+        self._style_job = None
+        self._pending_theme = None
+        self._pending_font_size = None
+        self._current_theme = None
         self.available_themes = ttk.Style().theme_names()
         
         # Apply theme
@@ -105,9 +364,15 @@ class YTScriptGUI(tk.Tk):
         
         # Create variables
         self.youtube_url = tk.StringVar()
-        self.output_dir = tk.StringVar(value=self._load_last_output_dir())
-        self.whisper_path = tk.StringVar(value=self.config["whisper_path"])
-        self.model_path = tk.StringVar(value=self.config["model_path"])
+        self.output_dir = tk.StringVar(value=self._prefs["last_output_dir"])
+        self.whisper_path = tk.StringVar(value=self.config.whisper_path)
+        self.model_path = tk.StringVar(value=self.config.model_path)
+        
+        # Resolved whisper.cpp executable and model file, and the result of the
+        # last successful settings check; both are refreshed when a path changes
+        self.whisper_path.trace_add("write", self._refresh_resolved_paths)
+        self.model_path.trace_add("write", self._refresh_resolved_paths)
+        self._refresh_resolved_paths()
         self.keep_audio = tk.BooleanVar(value=False)
         self.generate_srt = tk.BooleanVar(value=False)
         self.language = tk.StringVar()
@@ -116,6 +381,7 @@ class YTScriptGUI(tk.Tk):
         
         # Load history
         self.history = self._load_history()
+        self._history_job = None
         
         # Create main frame with padding
         main_frame = ttk.Frame(self, padding="10")
@@ -132,6 +398,15 @@ class YTScriptGUI(tk.Tk):
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True)
         
+        # Index of the selected tab, kept up to date by _on_tab_changed; the
+        # history rows are filled in when that tab is first shown
+        self._active_tab = 0
+        self._history_populated = False
+        
+        # Whether the environment info must be gathered again before it is shown
+        self._env_info_dirty = True
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        
         # Create main tab
         main_tab = ttk.Frame(self.notebook, padding="10")
         self.notebook.add(main_tab, text="Transcribe")
@@ -193,6 +468,65 @@ class YTScriptGUI(tk.Tk):
         self._check_settings()
         self._update_summary_ui()
         self._setup_keyboard_shortcuts()
+        
+        # Tooltips are not needed for the first paint
+        self.after_idle(self._create_tooltips)
+    
+    def _post_ui(self, callback, *args):
+        """
+        Queue a UI callback from a worker thread to run on the Tk thread.
+        
+        The worker must have been started with _start_worker, which keeps
+        the queue pumped while it runs.
+        
+        Args:
+            callback: Callable that updates widgets
+            *args: Arguments passed to the callback
+        """
+        self.ui_queue.put_nowait((callback, args))
+    
+    def _start_worker(self, target, *args):
+        """
+        Run a function on a daemon thread and pump its UI updates until it ends.
+        
+        Must be called on the Tk thread.
+        
+        Args:
+            target: Function to run on the worker thread
+            *args: Arguments passed to the function
+        
+        Returns:
+            The started threading.Thread
+        """
+        thread = threading.Thread(target=target, args=args, daemon=True)
+        thread.start()
+        self._workers = [worker for worker in self._workers if worker.is_alive()]
+        self._workers.append(thread)
+        if self._pump_job is None:
+            self._pump_job = self.after(30, self._pump_ui)
+        return thread
+    
+    def _pump_ui(self):
+        """Run queued UI callbacks and pending progress on the Tk thread."""
+        # Checked before draining, so whatever a finished worker posted
+        # before exiting is handled in this pass
+        self._workers = [worker for worker in self._workers if worker.is_alive()]
+        
+        while True:
+            try:
+                callback, args = self.ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            callback(*args)
+        
+        if self._pending_progress is not None or self._pending_status is not None:
+            self._flush_progress()
+        
+        # Go idle once no worker can post anything more
+        if self._workers or not self.ui_queue.empty():
+            self._pump_job = self.after(30, self._pump_ui)
+        else:
+            self._pump_job = None
     
     def _setup_main_tab(self, parent):
         """Set up the main tab UI elements."""
@@ -306,7 +640,11 @@ class YTScriptGUI(tk.Tk):
             console_frame, 
             wrap=tk.WORD, 
             height=10,
-            background="#f5f5f5"  # Light gray background
+            undo=False,  # Output only; no need to record inserts for undo
+            autoseparators=False,
+            maxundo=0,
+            font=("TkFixedFont", 11),  # Matches the default console font size setting
+            **THEME_PALETTES["dark" if self.theme_mode.get() == "dark" else "light"]["console"]
         )
         self.console.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         self.console.configure(state='disabled')
@@ -314,8 +652,10 @@ class YTScriptGUI(tk.Tk):
         # Setup text redirection
         self.redirect = RedirectText(self.console)
         
-        # Initialize process variable
+        # Initialize process variables
         self.process = None
+        self.transcriber = None
+        self._cancel_event = threading.Event()
     
     def _setup_settings_tab(self, parent):
         """Set up the settings tab UI elements."""
@@ -401,7 +741,7 @@ class YTScriptGUI(tk.Tk):
                 text=theme.capitalize(),
                 variable=self.theme_mode,
                 value=theme,
-                command=lambda: self._apply_theme(self.theme_mode.get())
+                command=lambda: self._schedule_style(theme=self.theme_mode.get())
             )
             rb.pack(anchor=tk.W, padx=20, pady=2)
         
@@ -451,13 +791,11 @@ class YTScriptGUI(tk.Tk):
         env_frame = ttk.LabelFrame(parent, text="Environment Information", padding="5")
         env_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
-        env_text = scrolledtext.ScrolledText(env_frame, wrap=tk.WORD, height=10)
-        env_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Get environment info
-        env_info = self._get_environment_info()
-        env_text.insert(tk.END, env_info)
-        env_text.configure(state='disabled')
+        # Filled in when the Settings tab is shown (see _on_tab_changed)
+        self.env_text = scrolledtext.ScrolledText(env_frame, wrap=tk.WORD, height=10)
+        self.env_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.env_text.insert(tk.END, "Loading...")
+        self.env_text.configure(state='disabled')
         
         # Tools management
         tools_frame = ttk.LabelFrame(parent, text="External Tools", padding="5")
@@ -510,8 +848,11 @@ class YTScriptGUI(tk.Tk):
             "📚 History tracking of transcribed videos"
         ]
         
-        for feature in features:
-            ttk.Label(features_frame, text=feature).pack(anchor=tk.W, pady=2)
+        ttk.Label(
+            features_frame,
+            text="\n".join(features),
+            justify=tk.LEFT
+        ).pack(anchor=tk.W, pady=2)
         
         # Links section
         links_frame = ttk.LabelFrame(about_frame, text="Links", padding="10")
@@ -520,41 +861,16 @@ class YTScriptGUI(tk.Tk):
         # Style for links
         link_style = {"foreground": "blue", "cursor": "hand2"}
         
-        # GitHub link
-        github_link = ttk.Label(
-            links_frame, 
-            text="GitHub Repository", 
-            **link_style
-        )
-        github_link.pack(anchor=tk.W, pady=2)
-        github_link.bind(
-            "<Button-1>", 
-            lambda e: webbrowser.open_new("https://github.com/yourusername/YTScript")
-        )
-        
-        # Whisper.cpp link
-        whisper_link = ttk.Label(
-            links_frame, 
-            text="whisper.cpp", 
-            **link_style
-        )
-        whisper_link.pack(anchor=tk.W, pady=2)
-        whisper_link.bind(
-            "<Button-1>", 
-            lambda e: webbrowser.open_new("https://github.com/ggerganov/whisper.cpp")
+        links = (
+            ("GitHub Repository", "https://github.com/yourusername/YTScript"),
+            ("whisper.cpp", "https://github.com/ggerganov/whisper.cpp"),
+            ("yt-dlp", "https://github.com/yt-dlp/yt-dlp"),
         )
         
-        # yt-dlp link
-        ytdlp_link = ttk.Label(
-            links_frame, 
-            text="yt-dlp", 
-            **link_style
-        )
-        ytdlp_link.pack(anchor=tk.W, pady=2)
-        ytdlp_link.bind(
-            "<Button-1>", 
-            lambda e: webbrowser.open_new("https://github.com/yt-dlp/yt-dlp")
-        )
+        for text, url in links:
+            link = ttk.Label(links_frame, text=text, **link_style)
+            link.pack(anchor=tk.W, pady=2)
+            link.bind("<Button-1>", lambda e, url=url: self._open_url(url))
         
         # Version and credits
         version_frame = ttk.Frame(about_frame)
@@ -567,7 +883,7 @@ class YTScriptGUI(tk.Tk):
         update_btn = ttk.Button(
             version_frame, 
             text="Check for Updates",
-            command=lambda: webbrowser.open_new("https://github.com/yourusername/YTScript/releases")
+            command=lambda: self._open_url("https://github.com/yourusername/YTScript/releases")
         )
         update_btn.pack(side=tk.LEFT, padx=5)
         
@@ -583,6 +899,11 @@ class YTScriptGUI(tk.Tk):
         )
         credits_label.pack(side=tk.BOTTOM)
     
+    def _open_url(self, url):
+        """Open a URL in the default web browser."""
+        import webbrowser
+        webbrowser.open_new(url)
+    
     def _browse_output_dir(self):
         """Open directory browser dialog and update output directory."""
         directory = filedialog.askdirectory(initialdir=self.output_dir.get())
@@ -603,25 +924,32 @@ class YTScriptGUI(tk.Tk):
     def _paste_url(self):
         """Paste clipboard content to URL field."""
         try:
-            clipboard_content = self.clipboard_get()
-            if self._is_youtube_url(clipboard_content):
-                self.youtube_url.set(clipboard_content)
+            url = self._extract_youtube_url(self.clipboard_get())
+            if url:
+                self.youtube_url.set(url)
             else:
                 messagebox.showwarning("Not a YouTube URL", "The clipboard content doesn't appear to be a YouTube URL.")
         except tk.TclError:
             messagebox.showwarning("Clipboard Empty", "Clipboard is empty or contains non-text content.")
     
-    def _is_youtube_url(self, text):
-        """Check if text is a valid YouTube URL."""
-        youtube_regex = r"(?:https?://)?(?:www\.)?youtu(?:\.be/|be\.com/(?:watch\?(?:.*&)?v=|embed/|v/|shorts/))([\w\-]+)(?:[?&]t=\d+)?(?:[?&]list=[\w\-]+)?"
-        return re.match(youtube_regex, text) is not None
+    def _extract_youtube_url(self, text):
+        """
+        Check text for a YouTube URL, matching it only once.
+        
+        Args:
+            text: Pasted or dropped text
+        
+        Returns:
+            The URL with surrounding whitespace removed, or None if it is not a YouTube URL
+        """
+        text = text.strip()
+        return text if YOUTUBE_URL_RE.match(text) else None
     
     def _save_settings(self):
         """Save settings to config file."""
-        config_dir = Path(os.path.expanduser("~/.config/ytscript"))
-        config_dir.mkdir(parents=True, exist_ok=True)
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         
-        config_path = config_dir / "config.json"
+        config_path = CONFIG_DIR / "config.json"
         
         config = {
             "whisper_path": self.whisper_path.get(),
@@ -629,28 +957,55 @@ class YTScriptGUI(tk.Tk):
         }
         
         try:
-            import json
             with open(config_path, "w") as f:
                 json.dump(config, f, indent=2)
             
+            # Drop the cached config so the saved values are picked up
+            self.config = reload_config()
+            
             messagebox.showinfo("Settings Saved", f"Configuration saved to: {config_path}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save configuration: {e}")
     
-    def _populate_model_list(self):
-        """Populate the LLM model combobox."""
+    def _populate_model_list(self, refresh=False):
+        """
+        Populate the LLM model combobox.
+        
+        The model directories are scanned on a background thread so the
+        window is not blocked while the list is built.
+        
+        Args:
+            refresh: Whether to rescan instead of using the cached model list
+        """
         if not SUMMARIZER_AVAILABLE:
             return
         
+        self.model_combo['values'] = ["Scanning..."]
+        self._start_worker(self._scan_models, refresh)
+    
+    def _scan_models(self, refresh):
+        """Look up available LLM models in a background thread."""
         try:
-            models = get_available_models()
-            if models:
-                self.model_combo['values'] = [str(model) for model in models]
-                self.model_combo.current(0)  # Select first model
-            else:
-                self.model_combo['values'] = ["No models found"]
+            from summarizer import get_available_models
+            if refresh:
+                get_available_models.cache_clear()
+            values = [str(model) for model in get_available_models()]
+            error = None
         except Exception as e:
-            self.model_combo['values'] = [f"Error: {e}"]
+            values = []
+            error = e
+        
+        self._post_ui(self._apply_model_values, values, error)
+    
+    def _apply_model_values(self, values, error=None):
+        """Fill the LLM model combobox with the scan results."""
+        if error is not None:
+            self.model_combo['values'] = [f"Error: {error}"]
+        elif values:
+            self.model_combo['values'] = values
+            self.model_combo.current(0)  # Select first model
+        else:
+            self.model_combo['values'] = ["No models found"]
     
     def _update_summary_ui(self):
         """Update the UI based on whether summary generation is enabled."""
@@ -679,7 +1034,7 @@ class YTScriptGUI(tk.Tk):
         # Start redirection
         self.old_stdout = sys.stdout
         sys.stdout = self.redirect
-        self.redirect.update_widget()
+        self.redirect.start_updates()
         
         # Update UI state
         self.run_btn.configure(state=tk.DISABLED)
@@ -687,41 +1042,66 @@ class YTScriptGUI(tk.Tk):
         self.status_var.set("Transcribing...")
         
         # Show progress bar
+        self._pending_progress = None
+        self._pending_status = None
         self.progress_var.set(0)
         self.progress_bar.pack(side=tk.RIGHT, padx=10)
         
+        # Read the Tk variables here; the worker thread must not touch them
+        options = {
+            "whisper_path": self.whisper_path.get(),
+            "model_path": self.model_path.get(),
+            "youtube_url": self.youtube_url.get().strip(),
+            "output_dir": self.output_dir.get(),
+            "generate_srt": self.generate_srt.get(),
+            "language": self.language.get() or None,
+            "keep_audio": self.keep_audio.get(),
+            "summarize": SUMMARIZER_AVAILABLE and self.generate_summary.get(),
+            "llm_path": self.llm_path.get(),
+        }
+        
         # Start thread
-        self.thread = threading.Thread(target=self._transcription_thread)
-        self.thread.daemon = True
-        self.thread.start()
+        self._cancel_event = threading.Event()
+        self.transcriber = None
+        self.thread = self._start_worker(self._transcription_thread, options)
     
-    def _transcription_thread(self):
-        """Run transcription in a background thread."""
+    def _transcription_thread(self, options):
+        """
+        Run transcription in a background thread.
+        
+        Args:
+            options: Snapshot of the form values taken on the Tk thread
+        """
         try:
             # Update progress
-            self.after(0, lambda: self.progress_var.set(10))
+            self._set_progress(10)
             
             # Create YTScript instance
             transcriber = YTScript(
-                whisper_path=self.whisper_path.get(),
-                model_path=self.model_path.get(),
-                verbose=True
+                whisper_path=options["whisper_path"],
+                model_path=options["model_path"],
+                verbose=True,
+                cancel_event=self._cancel_event
             )
+            self.transcriber = transcriber
             
             # Update progress
-            self.after(0, lambda: self.progress_var.set(20))
+            self._set_progress(20)
             
             # Process video
             txt_path, srt_path = transcriber.process_video(
-                youtube_url=self.youtube_url.get().strip(),
-                output_dir=self.output_dir.get(),
-                generate_srt=self.generate_srt.get(),
-                language=self.language.get() if self.language.get() else None,
-                keep_audio=self.keep_audio.get()
+                youtube_url=options["youtube_url"],
+                output_dir=options["output_dir"],
+                generate_srt=options["generate_srt"],
+                language=options["language"],
+                keep_audio=options["keep_audio"]
             )
             
             # Update progress
-            self.after(0, lambda: self.progress_var.set(80))
+            self._set_progress(80)
+            
+            if self._cancel_event.is_set():
+                raise OperationCancelled()
             
             print("\nTranscription complete!")
             print(f"Text transcript saved to: {txt_path}")
@@ -731,25 +1111,26 @@ class YTScriptGUI(tk.Tk):
             # Print preview
             if txt_path and txt_path.exists():
                 with open(txt_path, 'r') as f:
-                    preview = "".join(f.readlines()[:5])
+                    preview = "".join(itertools.islice(f, 5))
                     print("\nTranscript preview:")
                     print("-" * 40)
                     print(preview + "...")
                     print("-" * 40)
             
             # Generate summary if requested
-            if SUMMARIZER_AVAILABLE and self.generate_summary.get() and self.llm_path.get():
+            if options["summarize"] and options["llm_path"]:
                 print("\nGenerating summary...")
-                self.after(0, lambda: self.progress_var.set(85))
+                self._set_progress(85, status="Summarizing...")
                 
                 try:
+                    from summarizer import LocalSummarizer
                     summarizer = LocalSummarizer(
-                        model_path=self.llm_path.get(),
+                        model_path=options["llm_path"],
                         verbose=True
                     )
                     
                     summary = summarizer.summarize_transcript(txt_path)
-                    self.after(0, lambda: self.progress_var.set(95))
+                    self._set_progress(95)
                     
                     if not summary.startswith("Error:"):
                         summary_path = summarizer.save_summary(txt_path, summary)
@@ -764,17 +1145,52 @@ class YTScriptGUI(tk.Tk):
                     print(f"\nError during summarization: {e}")
             
             # Update progress to complete
-            self.after(0, lambda: self.progress_var.set(100))
+            self._set_progress(100)
             
             # Update UI on the main thread
-            self.after(0, lambda: self._update_ui_after_completion("Transcription completed"))
+            self._post_ui(self._update_ui_after_completion, "Transcription completed")
             
+        except OperationCancelled:
+            print("\nOperation cancelled.")
+            self._post_ui(self._update_ui_after_completion, "Operation cancelled by user", False, True)
         except Exception as e:
             print(f"\nError: {str(e)}")
-            self.after(0, lambda: self._update_ui_after_completion(f"Error: {str(e)}", error=True))
+            self._post_ui(self._update_ui_after_completion, f"Error: {str(e)}", True)
+    
+    def _set_progress(self, value, status=None):
+        """
+        Record progress from any thread; _pump_ui applies the latest value.
+        
+        Args:
+            value: Progress bar value (0-100)
+            status: Optional status bar message applied in the same update
+        """
+        if status is not None:
+            self._pending_status = status
+        self._pending_progress = value
     
-    def _update_ui_after_completion(self, status_message, error=False):
-        """Update UI after transcription completes."""
+    def _flush_progress(self):
+        """Apply the most recent pending progress value to the progress bar."""
+        status = self._pending_status
+        self._pending_status = None
+        value = self._pending_progress
+        self._pending_progress = None
+        if status is not None:
+            self.status_var.set(status)
+        if value is not None:
+            self.progress_var.set(value)
+    
+    def _update_ui_after_completion(self, status_message, error=False, cancelled=False):
+        """
+        Update UI after transcription completes.
+        
+        Args:
+            status_message: Message shown in the status bar
+            error: Whether the operation failed
+            cancelled: Whether the operation was cancelled by the user
+        """
+        self.transcriber = None
+        
         # Restore stdout
         sys.stdout = self.old_stdout
         self.redirect.stop_updates()
@@ -788,15 +1204,11 @@ class YTScriptGUI(tk.Tk):
         self.progress_bar.pack_forget()
         
         # Add to history if successful and not an error
-        if not error and self.youtube_url.get().strip():
+        if not error and not cancelled and self.youtube_url.get().strip():
             self._add_to_history(
                 self.youtube_url.get().strip(),
                 self.output_dir.get()
             )
-            
-            # Update history view if it's visible
-            if self.notebook.index(self.notebook.select()) == 1:  # History tab
-                self._populate_history()
         
         if error:
             messagebox.showerror("Error", status_message)
@@ -806,11 +1218,20 @@ class YTScriptGUI(tk.Tk):
         if messagebox.askyesno("Cancel Operation", "Are you sure you want to cancel the current operation?"):
             print("\nCancelling operation...")
             
-            # Try to cancel the process if it's running
+            # Signal the worker and stop its subprocess; the worker restores
+            # the UI once it has unwound
             if hasattr(self, 'thread') and self.thread.is_alive():
-                # This is a hacky way to interrupt the thread
-                # In a real app, you would need a proper cancellation mechanism
-                self._update_ui_after_completion("Operation cancelled by user")
+                self._cancel_event.set()
+                self.cancel_btn.configure(state=tk.DISABLED)
+                self.status_var.set("Cancelling...")
+                
+                # Stopping may wait for the processes to exit; keep it off the Tk thread
+                process = self.process
+                if process is not None:
+                    threading.Thread(target=stop_process, args=(process,), daemon=True).start()
+                if self.transcriber is not None:
+                    # Stops every download of a batch, not just one of them
+                    threading.Thread(target=self.transcriber.cancel, daemon=True).start()
     
     def _open_output_folder(self):
         """Open the output directory in file explorer."""
@@ -820,12 +1241,7 @@ class YTScriptGUI(tk.Tk):
             messagebox.showerror("Error", "Output directory does not exist")
             return
         
-        if sys.platform == 'win32':
-            os.startfile(output_dir)
-        elif sys.platform == 'darwin':  # macOS
-            subprocess.run(['open', output_dir])
-        else:  # Linux
-            subprocess.run(['xdg-open', output_dir])
+        self._open_directory(output_dir)
     
     def _run_setup(self):
         """Run the setup script."""
@@ -838,7 +1254,7 @@ class YTScriptGUI(tk.Tk):
             # Start redirection
             self.old_stdout = sys.stdout
             sys.stdout = self.redirect
-            self.redirect.update_widget()
+            self.redirect.start_updates()
             
             # Update UI state
             self.run_btn.configure(state=tk.DISABLED)
@@ -846,9 +1262,8 @@ class YTScriptGUI(tk.Tk):
             self.status_var.set("Running setup...")
             
             # Start thread
-            self.thread = threading.Thread(target=self._setup_thread)
-            self.thread.daemon = True
-            self.thread.start()
+            self._cancel_event = threading.Event()
+            self.thread = self._start_worker(self._setup_thread)
     
     def _setup_thread(self):
         """Run setup in a background thread."""
@@ -856,39 +1271,87 @@ class YTScriptGUI(tk.Tk):
             # Get path to setup script
             setup_script = Path(__file__).parent / "setup.py"
             
-            # Run setup script
-            subprocess.run([sys.executable, str(setup_script)], check=True)
+            # Run setup script unbuffered and stream its output to the console
+            # as it arrives instead of leaving the user blind until it exits
+            command = [sys.executable, "-u", str(setup_script)]
+            self.process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True
+            )
+            try:
+                if self._cancel_event.is_set():
+                    self.process.terminate()
+                for line in self.process.stdout:
+                    print(line, end="")
+                returncode = self.process.wait()
+            finally:
+                self.process.stdout.close()
+                self.process = None
+            
+            if self._cancel_event.is_set():
+                raise OperationCancelled()
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, command)
             
             # Reload config
-            self.config = load_config()
+            config = reload_config()
             
             # Update UI
-            self.after(0, lambda: self._after_setup())
+            self._post_ui(self._after_setup, config)
             
+        except OperationCancelled:
+            print("\nSetup cancelled.")
+            self._post_ui(self._update_ui_after_completion, "Setup cancelled by user", False, True)
         except Exception as e:
             print(f"\nError during setup: {e}")
-            self.after(0, lambda: self._update_ui_after_completion(f"Setup failed: {str(e)}", error=True))
+            self._post_ui(self._update_ui_after_completion, f"Setup failed: {str(e)}", True)
     
-    def _after_setup(self):
-        """Actions to perform after setup completes."""
+    def _after_setup(self, config):
+        """
+        Actions to perform after setup completes.
+        
+        Args:
+            config: Configuration reloaded by the setup thread
+        """
         # Reload paths from config
-        self.whisper_path.set(self.config["whisper_path"])
-        self.model_path.set(self.config["model_path"])
+        self.config = config
+        
+        # Setup may have installed tools, so probe them again next time
+        _probe_tool_versions.cache_clear()
+        self.whisper_path.set(self.config.whisper_path)
+        self.model_path.set(self.config.model_path)
         
         # Update UI
         self._update_ui_after_completion("Setup completed")
+        self._env_info_dirty = True
+        if self._active_tab == 2:
+            self._refresh_environment_info()
         
         # Repopulate models if available
         if SUMMARIZER_AVAILABLE:
-            self._populate_model_list()
+            self._populate_model_list(refresh=True)
+    
+    def _refresh_resolved_paths(self, *args):
+        """Resolve the path settings and forget the cached settings check."""
+        self._whisper_exe = Path(self.whisper_path.get()).expanduser().absolute() / "main"
+        self._model_file = Path(self.model_path.get()).expanduser().absolute()
+        self._settings_valid = False
+        self._env_info_dirty = True
     
     def _check_settings(self):
-        """Check if required settings are valid."""
-        # Check whisper path
-        whisper_path = Path(self.whisper_path.get()).expanduser().absolute()
-        whisper_executable = whisper_path / "main"
+        """
+        Check if required settings are valid.
+        
+        A successful check is remembered until the whisper or model path
+        changes, so repeated runs skip the file system checks.
+        """
+        if self._settings_valid:
+            return True
         
-        if not whisper_executable.exists():
+        # Check whisper path
+        if not self._whisper_exe.exists():
             messagebox.showwarning(
                 "Whisper.cpp Not Found", 
                 "The whisper.cpp executable was not found at the specified path.\n\n"
@@ -897,9 +1360,7 @@ class YTScriptGUI(tk.Tk):
             return False
         
         # Check model path
-        model_path = Path(self.model_path.get()).expanduser().absolute()
-        
-        if not model_path.exists():
+        if not self._model_file.exists():
             messagebox.showwarning(
                 "Whisper Model Not Found", 
                 "The Whisper model file was not found at the specified path.\n\n"
@@ -907,10 +1368,40 @@ class YTScriptGUI(tk.Tk):
             )
             return False
         
+        self._settings_valid = True
         return True
     
-    def _get_environment_info(self):
-        """Get information about the environment."""
+    def _collect_environment_info(self, env_text, whisper_exe, model_file):
+        """Gather environment info in a background thread and show it."""
+        env_info = self._get_environment_info(whisper_exe, model_file)
+        self._post_ui(self._fill_environment_info, env_text, env_info)
+    
+    def _fill_environment_info(self, env_text, env_info):
+        """Replace the contents of the environment info widget."""
+        if not env_text.winfo_exists():
+            return
+        
+        env_text.configure(state='normal')
+        env_text.delete(1.0, tk.END)
+        env_text.insert(tk.END, env_info)
+        env_text.configure(state='disabled')
+    
+    def _get_environment_info(self, whisper_exe=None, model_file=None):
+        """
+        Get information about the environment.
+        
+        Args:
+            whisper_exe: Resolved whisper.cpp executable to check (current setting if None)
+            model_file: Resolved Whisper model file to check (current setting if None)
+        
+        Returns:
+            Multi-line string describing the environment
+        """
+        if whisper_exe is None:
+            whisper_exe = self._whisper_exe
+        if model_file is None:
+            model_file = self._model_file
+        
         info = []
         
         # Python version
@@ -919,26 +1410,15 @@ class YTScriptGUI(tk.Tk):
         # OS info
         info.append(f"Platform: {sys.platform}")
         
-        # Check for yt-dlp
-        try:
-            result = subprocess.run(
-                ["yt-dlp", "--version"], 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE, 
-                text=True
-            )
-            info.append(f"yt-dlp: {result.stdout.strip() if result.returncode == 0 else 'Not found'}")
-        except (FileNotFoundError, subprocess.SubprocessError):
-            info.append("yt-dlp: Not found")
+        # Check external tools (probed once, then cached)
+        for tool, version in _probe_tool_versions():
+            info.append(f"{tool}: {version or 'Not found'}")
         
         # Check for whisper.cpp
-        whisper_path = Path(self.whisper_path.get()).expanduser().absolute()
-        whisper_executable = whisper_path / "main"
-        info.append(f"whisper.cpp: {'Found' if whisper_executable.exists() else 'Not found'}")
+        info.append(f"whisper.cpp: {'Found' if whisper_exe.exists() else 'Not found'}")
         
         # Check for model file
-        model_path = Path(self.model_path.get()).expanduser().absolute()
-        info.append(f"Whisper model: {'Found' if model_path.exists() else 'Not found'}")
+        info.append(f"Whisper model: {'Found' if model_file.exists() else 'Not found'}")
         
         # Check for summarizer
         info.append(f"Summarizer module: {'Available' if SUMMARIZER_AVAILABLE else 'Not available'}")
@@ -973,6 +1453,12 @@ class YTScriptGUI(tk.Tk):
         columns = ("date", "url", "output")
         self.history_tree = ttk.Treeview(history_frame, columns=columns, show="headings", selectmode="browse")
         
+        # Row values and item ids currently shown, aligned with self.history,
+        # plus the history entry behind each item id for constant-time lookups
+        self._history_rows = []
+        self._history_iids = []
+        self._history_by_iid = {}
+        
         # Define column headings
         self.history_tree.heading("date", text="Date")
         self.history_tree.heading("url", text="YouTube URL")
@@ -1021,27 +1507,67 @@ class YTScriptGUI(tk.Tk):
             text="Remove from History",
             command=self._remove_history_item
         ).pack(side=tk.LEFT, padx=5)
+    
+    def _on_tab_changed(self, event=None):
+        """
+        Record the selected tab.
         
-        # Populate history
-        self._populate_history()
+        Also populates the history list the first time its tab is selected.
+        """
+        self._active_tab = self.notebook.index("current")
+        
+        if not self._history_populated and self._active_tab == 1:
+            self._history_populated = True
+            self._populate_history()
+        
+        if self._env_info_dirty and self._active_tab == 2:
+            self._refresh_environment_info()
+    
+    def _refresh_environment_info(self):
+        """Gather the environment info again in the background."""
+        self._env_info_dirty = False
+        
+        # The version probes spawn subprocesses, so keep them off the Tk thread
+        self._start_worker(self._collect_environment_info, self.env_text, self._whisper_exe, self._model_file)
+    
+    def _history_row(self, item):
+        """Return the treeview values for a history entry."""
+        return (
+            item.get("date", "Unknown"),
+            item.get("url", "Unknown"),
+            item.get("output_dir", "Unknown")
+        )
     
     def _populate_history(self):
-        """Populate the history treeview with items from the history."""
-        # Clear existing items
-        for item in self.history_tree.get_children():
-            self.history_tree.delete(item)
-        
-        # Add history items
-        for item in self.history:
-            self.history_tree.insert(
-                "",
-                tk.END,
-                values=(
-                    item.get("date", "Unknown"),
-                    item.get("url", "Unknown"),
-                    item.get("output_dir", "Unknown")
-                )
-            )
+        """
+        Bring the history treeview in line with self.history.
+        
+        Only rows that changed are inserted, updated or deleted, so an
+        unchanged history costs no treeview operations at all.
+        """
+        rows = [self._history_row(item) for item in self.history]
+        iids = self._history_iids
+        matcher = difflib.SequenceMatcher(None, self._history_rows, rows, autojunk=False)
+        
+        # Apply the edits back to front so earlier row positions stay valid
+        for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+            if tag == "equal":
+                continue
+            
+            # Reuse existing rows for replacements, then delete or insert the rest
+            common = min(i2 - i1, j2 - j1)
+            for k in range(common):
+                self.history_tree.item(iids[i1 + k], values=rows[j1 + k])
+            if i2 - i1 > common:
+                self.history_tree.delete(*iids[i1 + common:i2])
+            new_iids = [
+                self.history_tree.insert("", i1 + common + k, values=rows[j1 + common + k])
+                for k in range(j2 - j1 - common)
+            ]
+            iids[i1:i2] = iids[i1:i1 + common] + new_iids
+        
+        self._history_rows = rows
+        self._history_by_iid = dict(zip(iids, self.history))
     
     def _show_history_menu(self, event):
         """Show the context menu for history items."""
@@ -1053,18 +1579,27 @@ class YTScriptGUI(tk.Tk):
             # Show the menu
             self.history_menu.post(event.x_root, event.y_root)
     
-    def _open_history_dir(self, *args):
-        """Open the output directory from the selected history item."""
+    def _selected_history_item(self):
+        """
+        Get the selected history item.
+        
+        Returns:
+            Tuple of (item id, history entry), or (None, None) if nothing is selected
+        """
         selection = self.history_tree.selection()
         if not selection:
             messagebox.showinfo("No Selection", "Please select a history item first.")
-            return
+            return None, None
         
         item_id = selection[0]
-        item_index = self.history_tree.index(item_id)
+        return item_id, self._history_by_iid.get(item_id)
+    
+    def _open_history_dir(self, *args):
+        """Open the output directory from the selected history item."""
+        item_id, entry = self._selected_history_item()
         
-        if 0 <= item_index < len(self.history):
-            output_dir = self.history[item_index].get("output_dir")
+        if entry is not None:
+            output_dir = entry.get("output_dir")
             
             if output_dir and os.path.exists(output_dir):
                 self._open_directory(output_dir)
@@ -1076,23 +1611,17 @@ class YTScriptGUI(tk.Tk):
         if sys.platform == 'win32':
             os.startfile(path)
         elif sys.platform == 'darwin':  # macOS
-            subprocess.run(['open', path])
+            _spawn_detached(['open', path])
         else:  # Linux
-            subprocess.run(['xdg-open', path])
+            _spawn_detached(['xdg-open', path])
     
     def _load_history_url(self, *args):
         """Load the URL from the selected history item into the transcribe tab."""
-        selection = self.history_tree.selection()
-        if not selection:
-            messagebox.showinfo("No Selection", "Please select a history item first.")
-            return
-        
-        item_id = selection[0]
-        item_index = self.history_tree.index(item_id)
+        item_id, entry = self._selected_history_item()
         
-        if 0 <= item_index < len(self.history):
-            url = self.history[item_index].get("url")
-            output_dir = self.history[item_index].get("output_dir")
+        if entry is not None:
+            url = entry.get("url")
+            output_dir = entry.get("output_dir")
             
             if url:
                 self.youtube_url.set(url)
@@ -1105,26 +1634,85 @@ class YTScriptGUI(tk.Tk):
     
     def _remove_history_item(self, *args):
         """Remove the selected item from history."""
-        selection = self.history_tree.selection()
-        if not selection:
-            messagebox.showinfo("No Selection", "Please select a history item first.")
-            return
-        
-        item_id = selection[0]
-        item_index = self.history_tree.index(item_id)
+        item_id, entry = self._selected_history_item()
         
-        if 0 <= item_index < len(self.history):
+        if entry is not None:
             # Remove from list
+            del self._history_by_iid[item_id]
+            item_index = self._history_iids.index(item_id)
             del self.history[item_index]
+            del self._history_rows[item_index]
+            del self._history_iids[item_index]
             
             # Update tree
             self.history_tree.delete(item_id)
             
             # Save updated history
-            self._save_history()
+            self._schedule_history_save()
+    
+    def _load_history(self):
+        """
+        Load the transcription history from disk.
+        
+        Returns:
+            List of history entries (dicts with date, url and output_dir)
+        """
+        try:
+            with open(CONFIG_DIR / "history.json", 'r') as f:
+                history = json.load(f)
+        except (OSError, ValueError):
+            return []
+        
+        return history if isinstance(history, list) else []
+    
+    def _schedule_history_save(self):
+        """Save the history shortly, merging changes made in quick succession."""
+        if self._history_job is not None:
+            self.after_cancel(self._history_job)
+        self._history_job = self.after(SETTINGS_SAVE_DELAY, self._save_history)
+    
+    def _save_history(self):
+        """Save the transcription history to disk."""
+        if self._history_job is not None:
+            self.after_cancel(self._history_job)
+            self._history_job = None
+        
+        try:
+            CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+            with open(CONFIG_DIR / "history.json", 'w') as f:
+                json.dump(self.history, f, indent=2)
+        except Exception as e:
+            print(f"Error saving history: {e}")
+    
+    def _add_to_history(self, url, output_dir):
+        """Add a transcribed video to the top of the history."""
+        self.history.insert(0, {
+            "date": datetime.now().strftime("%Y-%m-%d %H:%M"),
+            "url": url,
+            "output_dir": output_dir
+        })
+        del self.history[MAX_HISTORY:]
+        
+        # Show the new row at the top and drop any rows past the limit
+        row = self._history_row(self.history[0])
+        self._history_rows.insert(0, row)
+        item_id = self.history_tree.insert("", 0, values=row)
+        self._history_iids.insert(0, item_id)
+        self._history_by_iid[item_id] = self.history[0]
+        if len(self._history_iids) > MAX_HISTORY:
+            self.history_tree.delete(*self._history_iids[MAX_HISTORY:])
+            for stale_id in self._history_iids[MAX_HISTORY:]:
+                del self._history_by_iid[stale_id]
+            del self._history_iids[MAX_HISTORY:]
+            del self._history_rows[MAX_HISTORY:]
+        
+        self._schedule_history_save()
     
     def _refresh_history(self):
         """Refresh the history list."""
+        # Write a pending save first, or reloading would discard it
+        if self._history_job is not None:
+            self._save_history()
         self.history = self._load_history()
         self._populate_history()
     
@@ -1132,100 +1720,118 @@ class YTScriptGUI(tk.Tk):
         """Clear all history."""
         if messagebox.askyesno("Clear History", "Are you sure you want to clear all history?"):
             self.history = []
-            self._save_history()
+            self._schedule_history_save()
             self._populate_history()
     
-    def _load_theme_preference(self):
-        """Load theme preference from config file."""
-        config_dir = Path(os.path.expanduser("~/.config/ytscript"))
-        theme_file = config_dir / "theme.txt"
+    def _load_prefs(self):
+        """
+        Load the GUI preferences with a single read of the settings file.
+        
+        Falls back to the older theme.txt and last_output.txt files when no
+        settings file has been written yet.
+        
+        Returns:
+            dict with "theme" and "last_output_dir" entries
+        """
+        prefs = {
+            "theme": "light",
+            "last_output_dir": os.getcwd(),
+        }
+        
+        try:
+            with open(SETTINGS_FILE, 'rb') as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            saved = self._load_legacy_prefs()
+        except (OSError, ValueError):
+            saved = {}
+        
+        if not isinstance(saved, dict):
+            saved = {}
+        
+        if saved.get("theme") in ["light", "dark"]:
+            prefs["theme"] = saved["theme"]
+        
+        dir_path = saved.get("last_output_dir")
+        if isinstance(dir_path, str) and os.path.isdir(dir_path):
+            prefs["last_output_dir"] = dir_path
+        
+        return prefs
+    
+    def _load_legacy_prefs(self):
+        """
+        Read preferences saved by older versions in separate text files.
         
-        if theme_file.exists():
+        Returns:
+            dict with whichever preferences were found
+        """
+        saved = {}
+        
+        for key, name in (("theme", "theme.txt"), ("last_output_dir", "last_output.txt")):
             try:
-                with open(theme_file, 'r') as f:
-                    theme = f.read().strip()
-                    return theme if theme in ["light", "dark"] else "light"
-            except Exception:
-                return "light"
+                with open(CONFIG_DIR / name, 'r') as f:
+                    saved[key] = f.read().strip()
+            except (OSError, UnicodeDecodeError):
+                pass
         
-        return "light"
+        return saved
     
-    def _save_theme_preference(self, theme):
-        """Save theme preference to config file."""
-        config_dir = Path(os.path.expanduser("~/.config/ytscript"))
-        config_dir.mkdir(parents=True, exist_ok=True)
+    def _schedule_prefs_save(self):
+        """Write the preferences shortly, merging changes made in quick succession."""
+        if self._prefs_job is not None:
+            self.after_cancel(self._prefs_job)
+        self._prefs_job = self.after(SETTINGS_SAVE_DELAY, self._flush_prefs)
+    
+    def _flush_prefs(self):
+        """Write the preferences to the settings file atomically."""
+        if self._prefs_job is not None:
+            self.after_cancel(self._prefs_job)
+            self._prefs_job = None
         
-        theme_file = config_dir / "theme.txt"
+        tmp_file = SETTINGS_FILE.with_suffix(".json.tmp")
         
         try:
-            with open(theme_file, 'w') as f:
-                f.write(theme)
-        except Exception:
-            pass
+            CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'w') as f:
+                json.dump(self._prefs, f, indent=2)
+            os.replace(tmp_file, SETTINGS_FILE)
+        except Exception as e:
+            print(f"Error saving preferences: {e}")
+    
+    def _save_theme_preference(self, theme):
+        """Save theme preference to the settings file."""
+        self._prefs["theme"] = theme
+        self._schedule_prefs_save()
     
     def _apply_theme(self, theme_mode):
         """Apply the selected theme."""
+        if theme_mode == self._current_theme:
+            return
+        
+        palette = THEME_PALETTES["dark" if theme_mode == "dark" else "light"]
         style = ttk.Style()
         
-        if theme_mode == "dark":
-            # Dark theme
-            self.configure(bg="#2d2d2d")
+        # Switch the base theme only once; reapplying it resets every style
+        if self._current_theme is None:
             style.theme_use("clam")
-            
-            # Configure colors
-            style.configure(".", 
-                background="#2d2d2d", 
-                foreground="#ffffff",
-                fieldbackground="#3d3d3d"
-            )
-            
-            # Configure specific elements
-            style.configure("TLabel", background="#2d2d2d", foreground="#ffffff")
-            style.configure("TFrame", background="#2d2d2d")
-            style.configure("TButton", background="#3d3d3d", foreground="#ffffff")
-            style.configure("TNotebook", background="#2d2d2d", tabmargins=[2, 5, 2, 0])
-            style.configure("TNotebook.Tab", background="#3d3d3d", foreground="#ffffff", padding=[10, 2])
-            style.map("TNotebook.Tab", 
-                background=[("selected", "#4d4d4d")],
-                foreground=[("selected", "#ffffff")]
-            )
-            
-            # Custom styles
-            style.configure("Accent.TButton", background="#007bff", foreground="#ffffff")
-            
-            # Configure console
-            self.console.configure(background="#3d3d3d", foreground="#ffffff")
-        else:
-            # Light theme
-            self.configure(bg="#f0f0f0")
-            style.theme_use("clam")
-            
-            # Configure colors
-            style.configure(".", 
-                background="#f0f0f0", 
-                foreground="#000000",
-                fieldbackground="#ffffff"
-            )
-            
-            # Configure specific elements
-            style.configure("TLabel", background="#f0f0f0", foreground="#000000")
-            style.configure("TFrame", background="#f0f0f0")
-            style.configure("TButton", background="#e1e1e1", foreground="#000000")
-            style.configure("TNotebook", background="#f0f0f0", tabmargins=[2, 5, 2, 0])
-            style.configure("TNotebook.Tab", background="#e1e1e1", foreground="#000000", padding=[10, 2])
-            style.map("TNotebook.Tab", 
-                background=[("selected", "#f8f8f8")],
-                foreground=[("selected", "#000000")]
-            )
-            
-            # Custom styles
-            style.configure("Accent.TButton", background="#007bff", foreground="#ffffff")
-            
-            # Configure console
-            self.console.configure(background="#f5f5f5", foreground="#000000")
+        
+        self.configure(bg=palette["window"])
+        
+        # Configure all styles in a single pass
+        for name, options in palette["styles"].items():
+            style.configure(name, **options)
+        for name, options in palette["maps"].items():
+            style.map(name, **options)
+        
+        # Configure console (not yet created on the initial call)
+        if hasattr(self, "console"):
+            self.console.configure(**palette["console"])
+        
+        self._current_theme = theme_mode
         
         # Save theme preference
-        self._save_theme_preference(theme_mode)
+        if self._prefs["theme"] != theme_mode:
+            self._save_theme_preference(theme_mode)
     
     def _toggle_theme(self):
         """Toggle between light and dark themes."""
@@ -1233,18 +1839,48 @@ class YTScriptGUI(tk.Tk):
         new_theme = "light" if current_theme == "dark" else "dark"
         
         self.theme_mode.set(new_theme)
-        self._apply_theme(new_theme)
+        self._schedule_style(theme=new_theme)
     
     def _update_font_size(self, event=None):
         """Update the font size for the console."""
-        size = self.font_size.get()
-        self.console.configure(font=("TkFixedFont", int(size)))
+        self._schedule_style(font_size=self.font_size.get())
+    
+    def _schedule_style(self, theme=None, font_size=None):
+        """
+        Request a theme and/or console font change.
+        
+        Requests made in quick succession are coalesced so the widgets are
+        restyled only once, with the most recent values.
+        
+        Args:
+            theme: Theme to apply ("light" or "dark")
+            font_size: Console font size
+        """
+        if theme is not None:
+            self._pending_theme = theme
+        if font_size is not None:
+            self._pending_font_size = font_size
+        
+        if self._style_job is None:
+            self._style_job = self.after(50, self._flush_style)
+    
+    def _flush_style(self):
+        """Apply the pending theme and font size changes."""
+        self._style_job = None
+        
+        theme, self._pending_theme = self._pending_theme, None
+        font_size, self._pending_font_size = self._pending_font_size, None
+        
+        if theme is not None:
+            self._apply_theme(theme)
+        if font_size is not None:
+            self.console.configure(font=("TkFixedFont", int(font_size)))
     
     def _handle_drop(self, event):
         """Handle drag and drop of text (URL)."""
-        data = event.data
-        if self._is_youtube_url(data):
-            self.youtube_url.set(data)
+        url = self._extract_youtube_url(event.data)
+        if url:
+            self.youtube_url.set(url)
             self.notebook.select(0)  # Switch to transcribe tab
         else:
             messagebox.showwarning("Invalid URL", "The dropped text is not a valid YouTube URL.")
@@ -1265,35 +1901,35 @@ class YTScriptGUI(tk.Tk):
     
     def _copy_console(self):
         """Copy console content to clipboard."""
-        text = self.console.get(1.0, tk.END)
         self.clipboard_clear()
-        self.clipboard_append(text)
+        try:
+            # Evaluated entirely in Tcl so the text is never copied into Python
+            self.tk.eval(f"clipboard append -displayof . -- [{self.console._w} get 1.0 end-1c]")
+        except tk.TclError:
+            self.clipboard_append(self.console.get(1.0, 'end-1c'))
         self.status_var.set("Console output copied to clipboard")
     
     def _install_desktop_entry(self):
         """Install the desktop entry for the application."""
         try:
-            # Get install script path
-            install_script = Path(__file__).parent / "install_desktop.py"
-            
-            if not install_script.exists():
-                messagebox.showerror("Error", "Desktop integration script not found.")
-                return
-            
-            # Run the installation script
-            result = subprocess.run(
-                [sys.executable, str(install_script)],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            if result.returncode == 0:
-                messagebox.showinfo("Success", "Desktop entry installed successfully.")
-            else:
-                messagebox.showerror("Error", f"Failed to install desktop entry:\n{result.stderr}")
+            from install_desktop import install_desktop_entry
+        except ImportError:
+            messagebox.showerror("Error", "Desktop integration script not found.")
+            return
+        
+        # Install in-process, keeping the script's messages for the error dialog
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                installed = install_desktop_entry()
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {e}")
+            return
+        
+        if installed:
+            messagebox.showinfo("Success", "Desktop entry installed successfully.")
+        else:
+            messagebox.showerror("Error", f"Failed to install desktop entry:\n{output.getvalue()}")
     
     def _check_tool_updates(self):
         """Check for updates to external tools."""
@@ -1304,41 +1940,25 @@ class YTScriptGUI(tk.Tk):
         if messagebox.askyesno("Install Dependencies", "This will run the setup script to install missing dependencies. Continue?"):
             self._run_setup()
     
-    def _load_last_output_dir(self):
-        """Load the last used output directory from config."""
-        config_dir = Path(os.path.expanduser("~/.config/ytscript"))
-        output_dir_file = config_dir / "last_output.txt"
-        
-        if output_dir_file.exists():
-            try:
-                with open(output_dir_file, 'r') as f:
-                    dir_path = f.read().strip()
-                    if os.path.isdir(dir_path):
-                        return dir_path
-            except Exception:
-                pass
-        
-        return os.getcwd()
-    
     def _save_last_output_dir(self, output_dir):
-        """Save the last used output directory to config."""
-        config_dir = Path(os.path.expanduser("~/.config/ytscript"))
-        config_dir.mkdir(parents=True, exist_ok=True)
-        
-        output_dir_file = config_dir / "last_output.txt"
-        
-        try:
-            with open(output_dir_file, 'w') as f:
-                f.write(output_dir)
-        except Exception as e:
-            print(f"Error saving last output directory: {e}")
+        """Save the last used output directory to the settings file."""
+        self._prefs["last_output_dir"] = output_dir
+        self._schedule_prefs_save()
+    
+    def _on_close(self):
+        """Write any pending preferences and history and close the window."""
+        if self._prefs_job is not None:
+            self._flush_prefs()
+        if self._history_job is not None:
+            self._save_history()
+        self.destroy()
     
     def _setup_keyboard_shortcuts(self):
         """Set up keyboard shortcuts for the application."""
         # Main actions
         self.bind("<Control-r>", lambda e: self._run_transcription())
         self.bind("<Control-o>", lambda e: self._browse_output_dir())
-        self.bind("<Control-q>", lambda e: self.quit())
+        self.bind("<Control-q>", lambda e: self._on_close())
         self.bind("<Escape>", lambda e: self._cancel_operation())
         
         # Tab switching
@@ -1349,6 +1969,20 @@ class YTScriptGUI(tk.Tk):
         
         # Console actions
         self.bind("<Control-l>", lambda e: self._clear_console())
-        
-        # Add help text to UI elements using tooltips
-        self._create_tooltips()
+    
+    def _create_tooltips(self):
+        """Add help text to UI elements using tooltips."""
+        ToolTip(self.run_btn, "Download and transcribe the video (Ctrl+R)")
+        ToolTip(self.cancel_btn, "Stop the running operation (Esc)")
+        if SUMMARIZER_AVAILABLE:
+            ToolTip(self.model_combo, "Local LLM used to summarize the transcript")
+
+
+def main():
+    """Start the YTScript GUI."""
+    app = YTScriptGUI()
+    app.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ to make it easily accessible from desktop environments.
 import os
 import sys
 import shutil
+import tempfile
 from pathlib import Path
 import subprocess
 
@@ -60,24 +61,31 @@ def install_desktop_entry():
         
         desktop_content = desktop_content.replace('%INSTALL_PATH%', str(script_dir))
         
-        with open(target_desktop, 'w') as f:
-            f.write(desktop_content)
-        
-        # Make it executable
-        os.chmod(target_desktop, 0o755)
+        # Write to a temporary file next to the target and swap it in, so an
+        # interrupted install never leaves a half-written entry behind
+        fd, tmp_desktop = tempfile.mkstemp(dir=apps_dir, prefix=".ytscript.", suffix=".desktop")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(desktop_content)
+            
+            # Make it executable
+            os.chmod(tmp_desktop, 0o755)
+            os.replace(tmp_desktop, target_desktop)
+        except BaseException:
+            os.unlink(tmp_desktop)
+            raise
         
         print(f"Desktop entry installed to: {target_desktop}")
     except Exception as e:
         print(f"Failed to install desktop entry: {e}")
         return False
     
-    # Update desktop database
+    # Update desktop database in the background; nothing depends on its result
     try:
-        subprocess.run(
+        subprocess.Popen(
             ["update-desktop-database", str(apps_dir)],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            check=False
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
         )
     except Exception:
         # Not critical if this fails
@@ -94,4 +102,4 @@ if __name__ == "__main__":
     if os.geteuid() == 0:
         print("Warning: This script should not be run as root. Running for the current user...")
     
-    install_desktop_entry()
+    sys.exit(0 if install_desktop_entry() else 1)
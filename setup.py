@@ -14,56 +14,152 @@ import sys
 import platform
 import subprocess
 import argparse
+import functools
+import hashlib
+import re
 from pathlib import Path
 import shutil
 import urllib.request
 import zipfile
 import tarfile
 import time
+import threading
+import concurrent.futures
+from types import MappingProxyType
 
+# Size of each read while downloading (bytes)
+DOWNLOAD_BLOCK_SIZE = 1024 * 1024
 
-def run_command(command, description=None, exit_on_error=True):
-    """Run a shell command and optionally exit on error."""
+# apt package lists younger than this are reused without "apt-get update" (seconds)
+APT_LISTS_MAX_AGE = 24 * 60 * 60
+
+
+def run_command(command, description=None, exit_on_error=True, cwd=None):
+    """
+    Run a command without a shell and optionally exit on error.
+    
+    Args:
+        command: Command as an argument list, or a list of argument lists
+            that are run in order, stopping at the first failure
+        description: Message printed before running
+        exit_on_error: Whether to exit the script if a command fails
+        cwd: Working directory for the command(s)
+    
+    Returns:
+        True if every command succeeded, False otherwise
+    """
     if description:
         print(f"{description}...")
     
-    result = subprocess.run(
-        command, 
-        stdout=subprocess.PIPE, 
-        stderr=subprocess.PIPE, 
-        text=True,
-        shell=True
-    )
+    commands = command if isinstance(command[0], (list, tuple)) else [command]
     
-    if result.returncode != 0:
-        print(f"Command failed: {command}")
-        print(f"Error: {result.stderr}")
-        if exit_on_error:
-            sys.exit(1)
-        return False
+    for argv in commands:
+        argv = [str(arg) for arg in argv]
+        try:
+            result = subprocess.run(
+                argv,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=cwd
+            )
+            returncode, error = result.returncode, result.stderr
+        except OSError as e:
+            returncode, error = None, str(e)
+        
+        if returncode != 0:
+            print(f"Command failed: {' '.join(argv)}")
+            print(f"Error: {error}")
+            if exit_on_error:
+                sys.exit(1)
+            return False
     
     return True
 
 
+@functools.lru_cache(maxsize=None)
 def is_command_available(command):
-    """Check if a command is available in the system PATH."""
+    """
+    Check if a command is available in the system PATH.
+    
+    This is a PATH lookup only; the command is never run. Results are
+    cached, so call is_command_available.cache_clear() after installing
+    packages.
+    """
+    return shutil.which(command) is not None
+
+
+@functools.lru_cache(maxsize=1)
+def read_os_release():
+    """
+    Parse /etc/os-release once.
+    
+    Returns:
+        Read-only mapping of the os-release keys (empty if unavailable)
+    """
+    os_info = {}
     try:
-        # Use 'which' on Unix-like systems
-        subprocess.run(
-            ["which", command], 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE, 
-            check=True
+        with open('/etc/os-release', 'r') as f:
+            for line in f:
+                if '=' in line:
+                    key, value = line.rstrip().split('=', 1)
+                    os_info[key] = value.strip('"\'')
+    except OSError:
+        pass
+    
+    return MappingProxyType(os_info)
+
+
+def get_git_version():
+    """
+    Get the installed git version.
+    
+    Returns:
+        Version as a tuple of ints (e.g. (2, 39, 2)), or None if git is not usable
+    """
+    try:
+        result = subprocess.run(
+            ["git", "--version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
         )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        # Try another method just to be sure (works on most systems)
-        try:
-            devnull = open(os.devnull, "w")
-            subprocess.Popen([command], stdout=devnull, stderr=devnull).communicate()
-            return True
-        except (OSError, FileNotFoundError):
-            return False
+    except OSError:
+        return None
+    
+    # Output looks like "git version 2.39.2" (possibly with a platform suffix)
+    for word in result.stdout.split():
+        parts = word.split(".")
+        if len(parts) >= 2 and parts[0].isdigit() and parts[1].isdigit():
+            return tuple(int(part) for part in parts if part.isdigit())
+    return None
+
+
+def get_git_output(args, cwd=None):
+    """
+    Run a git command and return its output.
+    
+    Args:
+        args: Arguments passed to git
+        cwd: Directory to run git in
+    
+    Returns:
+        Stripped standard output, or None if git failed
+    """
+    try:
+        result = subprocess.run(
+            ["git"] + list(args),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=cwd
+        )
+    except OSError:
+        return None
+    
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
 
 
 def install_yt_dlp():
@@ -95,55 +191,60 @@ def install_system_dependencies():
     
     if system == "linux":
         # Try to detect Linux distribution
-        try:
-            # Try to read os-release file
-            os_info = {}
-            if os.path.exists('/etc/os-release'):
-                with open('/etc/os-release', 'r') as f:
-                    for line in f:
-                        if '=' in line:
-                            key, value = line.rstrip().split('=', 1)
-                            os_info[key] = value.strip('"\'')
-            
-            distro = os_info.get('ID', '').lower()
+        os_info = read_os_release()
+        distro = os_info.get('ID', '').lower()
+        if distro:
             print(f"Detected Linux distribution: {distro}")
-            
-            # Also check ID_LIKE for derivatives
-            distro_like = os_info.get('ID_LIKE', '').lower().split()
-        except Exception:
-            distro = ""
-            distro_like = []
+        else:
             print("Could not detect Linux distribution.")
         
+        # Also check ID_LIKE for derivatives
+        distro_like = os_info.get('ID_LIKE', '').lower().split()
+        
         # Detect package manager and install appropriate packages
         if is_command_available("apt-get") or distro in ["ubuntu", "debian", "mint", "pop"] or "debian" in distro_like:
-            # Debian/Ubuntu and derivatives
-            run_command(
-                "sudo apt-get update && sudo apt-get install -y build-essential cmake g++ git ffmpeg ccache",
-                "Installing dependencies with apt-get"
-            )
+            # Debian/Ubuntu and derivatives; sudo drops most of the
+            # environment, so the frontend is set through env
+            apt_get = ["sudo", "env", "DEBIAN_FRONTEND=noninteractive", "apt-get"]
+            commands = [
+                apt_get + ["install", "-y", "--no-install-recommends",
+                           "build-essential", "cmake", "g++", "git", "ffmpeg", "ccache"],
+            ]
+            
+            # Refreshing the package lists is often the slowest step, so
+            # skip it when they were updated recently
+            try:
+                lists_age = time.time() - os.path.getmtime("/var/lib/apt/lists")
+            except OSError:
+                lists_age = None
+            if lists_age is None or lists_age > APT_LISTS_MAX_AGE:
+                commands.insert(0, apt_get + ["update"])
+            
+            run_command(commands, "Installing dependencies with apt-get")
         elif is_command_available("dnf") or distro in ["fedora", "rhel", "centos", "rocky"] or any(d in distro_like for d in ["fedora", "rhel"]):
             # Fedora/RHEL/CentOS and derivatives
             run_command(
-                "sudo dnf install -y cmake gcc-c++ git make ffmpeg ccache",
+                ["sudo", "dnf", "install", "-y", "--setopt=install_weak_deps=False",
+                 "cmake", "gcc-c++", "git", "make", "ffmpeg", "ccache"],
                 "Installing dependencies with dnf"
             )
         elif is_command_available("pacman") or distro == "arch" or distro == "manjaro":
             # Arch Linux and derivatives
             run_command(
-                "sudo pacman -Sy --needed cmake gcc git make ffmpeg",
+                ["sudo", "pacman", "-Sy", "--needed", "--noconfirm", "cmake", "gcc", "git", "make", "ffmpeg"],
                 "Installing dependencies with pacman"
             )
         elif is_command_available("zypper") or distro == "opensuse":
             # openSUSE
             run_command(
-                "sudo zypper install -y cmake gcc-c++ git make ffmpeg",
+                ["sudo", "zypper", "--non-interactive", "install", "--no-recommends",
+                 "cmake", "gcc-c++", "git", "make", "ffmpeg"],
                 "Installing dependencies with zypper"
             )
         elif is_command_available("apk") or distro == "alpine":
             # Alpine Linux
             run_command(
-                "sudo apk add cmake g++ git make ffmpeg",
+                ["sudo", "apk", "add", "--no-cache", "cmake", "g++", "git", "make", "ffmpeg"],
                 "Installing dependencies with apk"
             )
         else:
@@ -156,7 +257,7 @@ def install_system_dependencies():
         # macOS
         if is_command_available("brew"):
             run_command(
-                "brew install cmake gcc git",
+                ["brew", "install", "cmake", "gcc", "git"],
                 "Installing dependencies with Homebrew"
             )
         else:
@@ -168,6 +269,10 @@ def install_system_dependencies():
         print("3. Git: https://git-scm.com/download/win")
     else:
         print(f"Unsupported platform: {system}")
+    
+    # Newly installed tools (e.g. ccache) must be found by later checks
+    is_command_available.cache_clear()
+    
     print("System dependencies installed successfully.")
     return True
 
@@ -182,6 +287,23 @@ def download_whisper_cpp(install_dir):
     Returns:
         Path to the whisper.cpp directory
     """
+    whisper_path = clone_whisper_cpp(install_dir)
+    if whisper_path is None:
+        return None
+    
+    return build_whisper_cpp(whisper_path)
+
+
+def clone_whisper_cpp(install_dir):
+    """
+    Clone whisper.cpp, or update an existing checkout.
+    
+    Args:
+        install_dir: Directory to install whisper.cpp
+    
+    Returns:
+        Path to the whisper.cpp directory, or None if it could not be cloned
+    """
     print("\n=== Setting up whisper.cpp ===")
     
     # Create the install directory if it doesn't exist
@@ -203,27 +325,44 @@ def download_whisper_cpp(install_dir):
                 print(f"Please manually remove {whisper_path} and try again.")
                 return None
         else:
-            # Reset any potential changes in the repository to avoid build issues
-            run_command(
-                f"cd {whisper_path} && git reset --hard && git clean -fd",
-                "Resetting whisper.cpp repository to clean state",
-                exit_on_error=False
-            )
+            # Reset any potential changes in the repository to avoid build
+            # issues; the reset and clean rewrite the whole tree, so only run
+            # them when git reports local changes (build outputs are ignored)
+            status = get_git_output(["status", "--porcelain"], cwd=whisper_path)
+            if status is None or status:
+                run_command(
+                    [["git", "reset", "--hard"], ["git", "clean", "-fd"]],
+                    "Resetting whisper.cpp repository to clean state",
+                    exit_on_error=False,
+                    cwd=whisper_path
+                )
     
     # Clone whisper.cpp if it doesn't exist
     if not whisper_path.exists():
         print(f"Cloning whisper.cpp to {whisper_path}...")
-        run_command(
-            f"git clone https://github.com/ggerganov/whisper.cpp.git {whisper_path}",
-            "Cloning whisper.cpp repository"
-        )
+        # Only the latest revision is needed to build; --shallow-submodules and
+        # --jobs need git 2.9 or newer
+        clone_command = ["git", "clone", "--depth=1", "--single-branch"]
+        git_version = get_git_version()
+        if git_version and git_version >= (2, 9):
+            clone_command += ["--recurse-submodules", "--shallow-submodules", f"--jobs={os.cpu_count() or 1}"]
+        clone_command += ["https://github.com/ggerganov/whisper.cpp.git", whisper_path]
+        run_command(clone_command, "Cloning whisper.cpp repository")
     else:
         print(f"whisper.cpp already exists at {whisper_path}")
-        # Pull the latest changes
-        run_command(
-            f"cd {whisper_path} && git pull",
-            "Updating whisper.cpp repository"
-        )
+        # Asking the remote for its HEAD is much cheaper than a fetch, so
+        # only fetch when the checkout is actually behind
+        local_head = get_git_output(["rev-parse", "HEAD"], cwd=whisper_path)
+        remote_head = get_git_output(["ls-remote", "origin", "HEAD"], cwd=whisper_path)
+        if local_head and remote_head and remote_head.split()[0] == local_head:
+            print("whisper.cpp is up to date.")
+        else:
+            # Fetch only the latest revision and move to it
+            run_command(
+                [["git", "fetch", "--depth=1", "origin"], ["git", "reset", "--hard", "FETCH_HEAD"]],
+                "Updating whisper.cpp repository",
+                cwd=whisper_path
+            )
     
     # Check if Makefile exists before attempting to build
     if not (whisper_path / "Makefile").exists():
@@ -231,56 +370,65 @@ def download_whisper_cpp(install_dir):
         print("The repository may not have been cloned correctly.")
         return None
     
+    return whisper_path
+
+
+def build_whisper_cpp(whisper_path):
+    """
+    Build a cloned whisper.cpp checkout.
+    
+    Args:
+        whisper_path: Path to the whisper.cpp directory
+    
+    Returns:
+        Path to the whisper.cpp directory, or None if the build failed
+    """
     # Build whisper.cpp
     print("Building whisper.cpp...")
     
+    # Compile with one job per CPU
+    jobs = os.cpu_count() or 1
+    
     # Use the Makefile directly (no "clean" target which might not exist)
-    build_cmd = f"cd {whisper_path} && make"
     result = run_command(
-        build_cmd,
+        ["make", f"-j{jobs}"],
         "Building whisper.cpp",
-        exit_on_error=False
+        exit_on_error=False,
+        cwd=whisper_path
     )
     
     # If that fails, try with cmake with special flags to bypass ccache if needed
     if not result:
         print("Standard build failed. Trying alternative build approach...")
         
+        # Optimize for this CPU (AVX2/AVX-512/NEON as available); whether
+        # ccache is used is a separate choice
+        configure_cmd = ["cmake", "-DGGML_NATIVE=ON"]
+        
         # Check if ccache is available
         if not is_command_available("ccache"):
             print("Note: ccache is not installed. Using alternative build configuration.")
-            # Set environment variable to disable ccache
-            cmake_build_cmd = (
-                f"cd {whisper_path} && "
-                f"mkdir -p build && cd build && "
-                f"cmake -DGGML_NATIVE=OFF -DGGML_NO_CCACHE=ON .. && "
-                f"cmake --build . --config Release"
-            )
-        else:
-            cmake_build_cmd = (
-                f"cd {whisper_path} && "
-                f"mkdir -p build && cd build && "
-                f"cmake .. && "
-                f"cmake --build . --config Release"
-            )
+            # Tell the build not to use ccache
+            configure_cmd.append("-DGGML_NO_CCACHE=ON")
+        configure_cmd.append("..")
         
+        build_dir = whisper_path / "build"
+        os.makedirs(build_dir, exist_ok=True)
         result = run_command(
-            cmake_build_cmd,
+            [configure_cmd, ["cmake", "--build", ".", "--config", "Release", "--parallel", str(jobs)]],
             "Building whisper.cpp with CMake",
-            exit_on_error=False
+            exit_on_error=False,
+            cwd=build_dir
         )
         
     # If that fails too, try one more approach with manual compilation flags
     if not result:
         print("CMake build failed. Trying basic build without optimization...")
-        basic_build_cmd = (
-            f"cd {whisper_path} && "
-            f"make CFLAGS=\"-O2\" whisper"
-        )
         result = run_command(
-            basic_build_cmd,
+            ["make", f"-j{jobs}", "CFLAGS=-O2", "whisper"],
             "Building whisper.cpp with basic options",
-            exit_on_error=False
+            exit_on_error=False,
+            cwd=whisper_path
         )
     
     # Check if the main executable exists in potential locations
@@ -317,6 +465,224 @@ def download_whisper_cpp(install_dir):
     return whisper_path
 
 
+class _RecordingRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """Redirect handler that keeps the headers of every redirect response."""
+    
+    def __init__(self):
+        self.redirect_headers = []
+    
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        self.redirect_headers.append(headers)
+        return super().redirect_request(req, fp, code, msg, headers, newurl)
+
+
+def _find_sha256(headers_list):
+    """
+    Find a SHA-256 checksum advertised in HTTP response headers.
+    
+    Hugging Face sends the checksum of LFS files as X-Linked-Etag on the
+    redirect to its CDN; some servers use it as the plain ETag.
+    
+    Args:
+        headers_list: Response headers to search, in order
+    
+    Returns:
+        Lowercase hex digest, or None if no checksum was found
+    """
+    for headers in headers_list:
+        for name in ("X-Linked-Etag", "ETag"):
+            value = (headers.get(name) or "").strip()
+            if value.startswith("W/"):
+                value = value[2:]
+            value = value.strip('"')
+            if re.fullmatch(r"[0-9a-fA-F]{64}", value):
+                return value.lower()
+    return None
+
+
+def _probe_download(url):
+    """
+    Check whether a server supports byte range requests for a URL.
+    
+    Args:
+        url: URL of the file to download
+    
+    Returns:
+        Tuple of (final URL after redirects, total size or None if ranges
+        are not supported, advertised SHA-256 or None)
+    """
+    redirects = _RecordingRedirectHandler()
+    opener = urllib.request.build_opener(redirects)
+    request = urllib.request.Request(url, headers={"Range": "bytes=0-0"})
+    with opener.open(request) as response:
+        final_url = response.geturl()
+        content_range = response.headers.get("Content-Range", "")
+        sha256 = _find_sha256(redirects.redirect_headers + [response.headers])
+        if response.status != 206 or "/" not in content_range:
+            return final_url, None, sha256
+    
+    total = content_range.rsplit("/", 1)[1]
+    return final_url, int(total) if total.isdigit() else None, sha256
+
+
+class _DownloadState:
+    """Progress of a parallel download, shared by the range workers."""
+    
+    def __init__(self, ranges, total, reporthook=None):
+        """
+        Args:
+            ranges: List of (start, end) byte ranges
+            total: Total size of the file
+            reporthook: Optional callable taking (bytes downloaded, total size)
+        """
+        self.written = [start for start, end in ranges]
+        self.total = total
+        self.downloaded = 0
+        self.reporthook = reporthook
+        self.cond = threading.Condition()
+    
+    def advance(self, index, count):
+        """Record count more bytes written at the end of range index."""
+        with self.cond:
+            self.written[index] += count
+            self.downloaded += count
+            self.cond.notify_all()
+            if self.reporthook:
+                self.reporthook(self.downloaded, self.total)
+
+
+def _download_range(url, fd, start, end, index, state):
+    """
+    Download one byte range of a file into its place in the destination.
+    
+    Args:
+        url: URL of the file
+        fd: File descriptor of the destination file
+        start: First byte of the range
+        end: Last byte of the range (inclusive)
+        index: Index of the range in state.written
+        state: _DownloadState shared by all ranges
+    """
+    request = urllib.request.Request(url, headers={"Range": f"bytes={start}-{end}"})
+    offset = start
+    with urllib.request.urlopen(request) as response:
+        if response.status != 206:
+            raise IOError(f"Server ignored range request for bytes {start}-{end}")
+        while True:
+            block = response.read(DOWNLOAD_BLOCK_SIZE)
+            if not block:
+                break
+            os.pwrite(fd, block, offset)
+            offset += len(block)
+            state.advance(index, len(block))
+    
+    if offset != end + 1:
+        raise IOError(f"Incomplete download of bytes {start}-{end}")
+
+
+def _preallocate(fd, size):
+    """
+    Reserve size bytes for a file up front.
+    
+    posix_fallocate lets the filesystem allocate the space in a few large
+    extents instead of growing the file block by block; where it is not
+    available or not supported the file is just extended to its size.
+    
+    Args:
+        fd: File descriptor open for writing
+        size: Final size of the file in bytes
+    """
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return
+        except OSError:
+            pass  # e.g. not supported by the filesystem
+    os.ftruncate(fd, size)
+
+
+def parallel_download(url, dest, workers=8, reporthook=None):
+    """
+    Download a file using several HTTP range requests at once.
+    
+    The SHA-256 of the file is computed while it downloads: the parts
+    already written are hashed in order straight from the page cache,
+    so no second pass over the finished file is needed. Falls back to a
+    single stream if the server does not support ranges.
+    
+    Args:
+        url: URL of the file to download
+        dest: Destination file path
+        workers: Number of concurrent range requests
+        reporthook: Optional callable taking (bytes downloaded, total size)
+    
+    Returns:
+        Tuple of (SHA-256 of the downloaded file, SHA-256 advertised by the
+        server or None)
+    """
+    final_url, total, expected_sha256 = _probe_download(url)
+    sha256 = hashlib.sha256()
+    
+    # Single stream for servers without range support (and without os.pwrite)
+    if total is None or not hasattr(os, "pwrite"):
+        with urllib.request.urlopen(final_url) as response, open(dest, "wb", buffering=0) as f:
+            size = int(response.headers.get("Content-Length") or -1)
+            if size > 0:
+                _preallocate(f.fileno(), size)
+            downloaded = 0
+            while True:
+                block = response.read(DOWNLOAD_BLOCK_SIZE)
+                if not block:
+                    break
+                f.write(block)
+                sha256.update(block)
+                downloaded += len(block)
+                if reporthook:
+                    reporthook(downloaded, size)
+        if size >= 0 and downloaded != size:
+            raise IOError(f"Incomplete download: got {downloaded} of {size} bytes")
+        return sha256.hexdigest(), expected_sha256
+    
+    # Split the file into one contiguous range per worker
+    part_size = -(-total // workers)
+    ranges = [(start, min(start + part_size, total) - 1) for start in range(0, total, part_size)]
+    state = _DownloadState(ranges, total, reporthook)
+    
+    fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    read_fd = os.open(dest, os.O_RDONLY)
+    try:
+        _preallocate(fd, total)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [
+                executor.submit(_download_range, final_url, fd, start, end, index, state)
+                for index, (start, end) in enumerate(ranges)
+            ]
+            
+            # Hash the file in order as each range's data arrives
+            position = 0
+            for index, (start, end) in enumerate(ranges):
+                while position <= end:
+                    with state.cond:
+                        while state.written[index] <= position:
+                            failed = [future for future in futures if future.done() and future.exception()]
+                            if failed:
+                                raise failed[0].exception()
+                            state.cond.wait(0.5)
+                        available = state.written[index]
+                    while position < available:
+                        block = os.pread(read_fd, min(DOWNLOAD_BLOCK_SIZE, available - position), position)
+                        sha256.update(block)
+                        position += len(block)
+            
+            for future in futures:
+                future.result()
+    finally:
+        os.close(read_fd)
+        os.close(fd)
+    
+    return sha256.hexdigest(), expected_sha256
+
+
 def download_whisper_model(models_dir, model_name="base.en"):
     """
     Download a Whisper model.
@@ -350,17 +716,43 @@ def download_whisper_model(models_dir, model_name="base.en"):
     
     try:
         # Create a progress reporting callback
-        def report_progress(block_num, block_size, total_size):
-            if total_size > 0:
-                percent = min(100, block_num * block_size * 100 / total_size)
-                # Only update progress every 5%
-                if int(percent) % 5 == 0:
-                    sys.stdout.write(f"\rDownloading: {percent:.1f}%")
-                    sys.stdout.flush()
+        # Rewrite the progress line in place on a terminal; elsewhere (CI
+        # logs, the GUI console) emit one plain line per 10%
+        interactive = sys.stdout.isatty()
+        step = 5 if interactive else 10
+        last_percent = [-1]
         
-        # Download the model with progress reporting
-        urllib.request.urlretrieve(model_url, model_path, reporthook=report_progress)
-        print(f"\nModel downloaded successfully to: {model_path}")
+        def report_progress(downloaded, total_size):
+            if total_size <= 0:
+                return
+            percent = int(min(100, downloaded * 100 / total_size))
+            # Only write when a new step is reached, not on every block
+            if percent == last_percent[0] or percent % step != 0:
+                return
+            last_percent[0] = percent
+            if interactive:
+                sys.stdout.write(f"\rDownloading: {percent}%")
+            else:
+                sys.stdout.write(f"Downloading: {percent}%\n")
+            sys.stdout.flush()
+        
+        # Download the model with progress reporting, retrying once if the
+        # checksum does not match the one published with the file
+        for attempt in range(2):
+            sha256, expected_sha256 = parallel_download(model_url, model_path, reporthook=report_progress)
+            if expected_sha256 is None:
+                print("\nNote: no checksum published for this model; skipping verification.")
+                break
+            if sha256 == expected_sha256:
+                print("\nChecksum verified.")
+                break
+            print(f"\nChecksum mismatch (expected {expected_sha256}, got {sha256}).")
+            if attempt == 0:
+                print("Downloading the model again...")
+        else:
+            raise IOError("Downloaded model is corrupted")
+        
+        print(f"Model downloaded successfully to: {model_path}")
         return model_path
     except Exception as e:
         print(f"\nFailed to download model: {e}")
@@ -445,22 +837,37 @@ def main():
     config_dir = Path(os.path.expanduser("~/.config/ytscript"))
     os.makedirs(config_dir, exist_ok=True)
     
-    # Install yt-dlp if requested
-    if not args.no_yt_dlp:
-        install_yt_dlp()
-    
-    # Install system dependencies if requested
-    if not args.no_system_deps:
-        install_system_dependencies()
+    # Independent steps run side by side: yt-dlp is installed with pip while
+    # whisper.cpp is set up, and the model downloads while whisper.cpp builds
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        # Install yt-dlp if requested
+        yt_dlp_future = None
+        if not args.no_yt_dlp:
+            yt_dlp_future = executor.submit(install_yt_dlp)
+        
+        # Install system dependencies if requested; stays in the foreground
+        # because the package manager may prompt for a sudo password
+        if not args.no_system_deps:
+            install_system_dependencies()
+        
+        # Download whisper.cpp (needs git from the system dependencies)
+        whisper_path = clone_whisper_cpp(install_dir)
+        if not whisper_path:
+            print("Failed to set up whisper.cpp. Please check the error messages above.")
+            sys.exit(1)
+        
+        # Download Whisper model while whisper.cpp builds
+        model_future = executor.submit(download_whisper_model, whisper_path / "models", args.model)
+        whisper_path = build_whisper_cpp(whisper_path)
+        model_path = model_future.result()
+        
+        if yt_dlp_future:
+            yt_dlp_future.result()
     
-    # Download and build whisper.cpp
-    whisper_path = download_whisper_cpp(install_dir)
     if not whisper_path:
         print("Failed to set up whisper.cpp. Please check the error messages above.")
         sys.exit(1)
     
-    # Download Whisper model
-    model_path = download_whisper_model(whisper_path / "models", args.model)
     if not model_path:
         print("Failed to download the Whisper model. Please check the error messages above.")
         sys.exit(1)
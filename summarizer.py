@@ -8,13 +8,68 @@ This module provides functionality to summarize transcripts using a local LLM.
 import os
 import sys
 import json
+import time
+import atexit
+import socket
+import functools
+import threading
 import subprocess
+import urllib.request
+import urllib.error
 from pathlib import Path
 
+# Context window requested from llama.cpp (tokens)
+CONTEXT_TOKENS = 16384
+
+# Default summary length (tokens)
+SUMMARY_TOKENS = 500
+
+# Tokens reserved for the prompt template around the transcript
+PROMPT_OVERHEAD_TOKENS = 256
+
+# Instructions for summarizing a whole transcript, one part of a long
+# transcript, and the combined summaries of those parts
+SUMMARY_INSTRUCTION = "Please summarize the following transcript in about 250 words:"
+PART_INSTRUCTION = "Please summarize the following part of a longer transcript in about 150 words:"
+COMBINE_INSTRUCTION = (
+    "The following are summaries of consecutive parts of one transcript. "
+    "Please combine them into a single summary of about 250 words:"
+)
+
+# Chat prompt wrapped around the instruction and the text to summarize
+PROMPT_TEMPLATE = (
+    "<|system|>\n"
+    "You are an AI assistant that summarizes transcripts accurately and concisely.\n"
+    "</s>\n"
+    "<|user|>\n"
+    "{instruction}\n"
+    "\n"
+    "{text}\n"
+    "</s>\n"
+    "<|assistant|>\n"
+)
+
+# llama.cpp server executables, newest name first
+SERVER_BINARIES = ("llama-server", "server")
+
+# Seconds to wait for the llama.cpp server to load a model
+SERVER_START_TIMEOUT = 300
+
+# Conservative characters-per-token estimate used when tiktoken is not
+# installed; transcripts with names and numbers tokenize densely
+CHARS_PER_TOKEN = 3.0
+
 
 class LocalSummarizer:
     """Class for summarizing transcripts using various local LLM options."""
     
+    # tiktoken encoder shared by all instances (False if unavailable)
+    _encoder = None
+    
+    # Running llama.cpp servers shared by all instances: model path -> (process, port)
+    _servers = {}
+    _servers_lock = threading.Lock()
+    
     def __init__(self, model_path=None, model_type="llama.cpp", verbose=False):
         """
         Initialize the summarizer with a local LLM.
@@ -40,13 +95,210 @@ class LocalSummarizer:
         if self.verbose:
             print(f"Using {self.model_type} model at: {self.model_path}")
     
-    def summarize_with_llama_cpp(self, transcript_text, max_length=500):
+    @classmethod
+    def _get_encoder(cls):
+        """
+        Get the tiktoken encoder, loading it on first use.
+        
+        Returns:
+            tiktoken Encoding, or None if tiktoken is not installed
+        """
+        if cls._encoder is None:
+            try:
+                import tiktoken
+                cls._encoder = tiktoken.get_encoding("cl100k_base")
+            except Exception:
+                cls._encoder = False  # Not installed or encoding unavailable
+        
+        return cls._encoder or None
+    
+    def _count_tokens(self, text):
+        """Count (or, without tiktoken, estimate) the tokens in text."""
+        encoder = self._get_encoder()
+        if encoder is not None:
+            return len(encoder.encode(text, disallowed_special=()))
+        return int(len(text) / CHARS_PER_TOKEN) + 1
+    
+    def _split_into_windows(self, text, window_tokens, overlap):
+        """
+        Split text into overlapping windows of about window_tokens tokens.
+        
+        Args:
+            text: Text to split
+            window_tokens: Size of each window in tokens
+            overlap: Number of tokens shared by consecutive windows
+        
+        Returns:
+            List of text windows
+        """
+        encoder = self._get_encoder()
+        if encoder is not None:
+            units = encoder.encode(text, disallowed_special=())
+            join = encoder.decode
+        else:
+            # Work in characters, scaled by the estimate
+            window_tokens = int(window_tokens * CHARS_PER_TOKEN)
+            overlap = int(overlap * CHARS_PER_TOKEN)
+            units = text
+            join = str
+        
+        step = window_tokens - overlap
+        return [
+            join(units[start:start + window_tokens])
+            for start in range(0, max(len(units) - overlap, 1), step)
+        ]
+    
+    def _truncate_to_tokens(self, text, n_tokens):
+        """
+        Truncate text to about n_tokens tokens.
+        
+        Uses tiktoken to count tokens when it is installed, otherwise an
+        estimate of CHARS_PER_TOKEN characters per token.
+        
+        Args:
+            text: Text to truncate
+            n_tokens: Maximum number of tokens to keep
+        
+        Returns:
+            The text, truncated and marked with "...[truncated]" if it was too long
+        """
+        encoder = self._get_encoder()
+        if encoder is not None:
+            tokens = encoder.encode(text, disallowed_special=())
+            if len(tokens) <= n_tokens:
+                return text
+            truncated = encoder.decode(tokens[:n_tokens])
+            if self.verbose:
+                print(f"Transcript is too long ({len(tokens)} tokens), truncating to {n_tokens} tokens")
+        else:
+            max_chars = int(n_tokens * CHARS_PER_TOKEN)
+            if len(text) <= max_chars:
+                return text
+            truncated = text[:max_chars]
+            if self.verbose:
+                print(f"Transcript is too long ({len(text)} chars), truncating to {max_chars} chars")
+        
+        return truncated + "...[truncated]"
+    
+    def summarize_long(self, transcript_text, window_tokens=6000, overlap=200):
+        """
+        Summarize a transcript too long for the context, map-reduce style.
+        
+        Each overlapping window of the transcript is summarized on its own,
+        then the partial summaries are combined into one.
+        
+        Args:
+            transcript_text: Text to summarize
+            window_tokens: Size of each window in tokens
+            overlap: Number of tokens shared by consecutive windows
+            
+        Returns:
+            Summary text
+        """
+        windows = self._split_into_windows(transcript_text, window_tokens, overlap)
+        if len(windows) == 1:
+            return self.summarize_with_llama_cpp(windows[0])
+        
+        partial_summaries = []
+        for number, window in enumerate(windows, 1):
+            if self.verbose:
+                print(f"Summarizing part {number} of {len(windows)}...")
+            summary = self.summarize_with_llama_cpp(window, instruction=PART_INSTRUCTION)
+            if summary.startswith("Error"):
+                return summary
+            partial_summaries.append(summary)
+        
+        if self.verbose:
+            print("Combining partial summaries...")
+        combined = self._truncate_to_tokens(
+            "\n\n".join(partial_summaries),
+            CONTEXT_TOKENS - SUMMARY_TOKENS - PROMPT_OVERHEAD_TOKENS
+        )
+        return self.summarize_with_llama_cpp(combined, instruction=COMBINE_INSTRUCTION)
+    
+    def _ensure_server(self):
+        """
+        Start a llama.cpp server for the model, or reuse a running one.
+        
+        The server keeps the model loaded, so only the first summary pays
+        for loading it. Servers are stopped when the interpreter exits.
+        
+        Returns:
+            Port the server listens on, or None if no server executable was found
+        
+        Raises:
+            RuntimeError: If the server does not start
+        """
+        key = str(self.model_path.absolute())
+        
+        with self._servers_lock:
+            server = self._servers.get(key)
+            if server is not None and server[0].poll() is None:
+                return server[1]
+            
+            candidates = (self.model_path.parent / name for name in SERVER_BINARIES)
+            server_path = next((path for path in candidates if path.exists()), None)
+            if server_path is None:
+                return None
+            
+            # Let the OS pick a free port
+            with socket.socket() as sock:
+                sock.bind(("127.0.0.1", 0))
+                port = sock.getsockname()[1]
+            
+            command = [
+                str(server_path),
+                "-m", str(self.model_path),
+                "--host", "127.0.0.1",
+                "--port", str(port),
+                "-c", str(CONTEXT_TOKENS)
+            ]
+            if self.verbose:
+                print(f"Starting llama.cpp server: {' '.join(command)}")
+            
+            process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if not self._servers:
+                atexit.register(LocalSummarizer.shutdown_servers)
+            self._servers[key] = (process, port)
+            
+            # Wait until the model is loaded
+            deadline = time.monotonic() + SERVER_START_TIMEOUT
+            while True:
+                if process.poll() is not None:
+                    del self._servers[key]
+                    raise RuntimeError(f"llama.cpp server exited with code {process.returncode}")
+                try:
+                    with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=2) as response:
+                        if response.status == 200:
+                            return port
+                except OSError:
+                    pass  # Not listening yet, or still loading (503)
+                if time.monotonic() > deadline:
+                    process.kill()
+                    del self._servers[key]
+                    raise RuntimeError("llama.cpp server did not start in time")
+                time.sleep(0.25)
+    
+    @classmethod
+    def shutdown_servers(cls):
+        """Stop all llama.cpp servers started by this process."""
+        with cls._servers_lock:
+            for process, port in cls._servers.values():
+                process.terminate()
+                try:
+                    process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+            cls._servers.clear()
+    
+    def summarize_with_llama_cpp(self, transcript_text, max_length=SUMMARY_TOKENS, instruction=SUMMARY_INSTRUCTION):
         """
         Summarize text using llama.cpp.
         
         Args:
             transcript_text: Text to summarize
             max_length: Maximum length of summary
+            instruction: Request placed before the text in the prompt
             
         Returns:
             Summary text
@@ -54,33 +306,36 @@ class LocalSummarizer:
         if not self.model_path or not self.model_path.exists():
             return "Error: No valid LLM model provided for summarization."
         
+        # Create a prompt for summarization
+        prompt = PROMPT_TEMPLATE.format(instruction=instruction, text=transcript_text)
+        
+        # Prefer a persistent server that keeps the model loaded
+        try:
+            port = self._ensure_server()
+        except RuntimeError as e:
+            return f"Error: {e}"
+        
+        if port is not None:
+            return self._complete_with_server(port, prompt, max_length)
+        
         llama_path = self.model_path.parent / "main"
         if not llama_path.exists():
             return "Error: llama.cpp executable not found."
-            
-        # Create a prompt for summarization
-        prompt = f"""<|system|>
-You are an AI assistant that summarizes transcripts accurately and concisely.
-</s>
-<|user|>
-Please summarize the following transcript in about 250 words:
-
-{transcript_text}
-</s>
-<|assistant|>
-"""
         
-        # Use a temporary file for the prompt
-        temp_prompt_file = Path("temp_prompt.txt")
-        with open(temp_prompt_file, "w") as f:
-            f.write(prompt)
+        # Pass the prompt through a pipe rather than a temporary file; llama.cpp
+        # reads it from /dev/stdin, or from the command line on Windows
+        if os.name == "posix":
+            prompt_args, prompt_input = ["-f", "/dev/stdin"], prompt
+        else:
+            prompt_args, prompt_input = ["-p", prompt], None
         
         try:
             # Run llama.cpp
             command = [
                 str(llama_path),
                 "-m", str(self.model_path),
-                "-f", str(temp_prompt_file),
+                *prompt_args,
+                "-c", str(CONTEXT_TOKENS),
                 "--temp", "0.7",
                 "--top-p", "0.9",
                 "-n", str(max_length),
@@ -88,10 +343,12 @@ Please summarize the following transcript in about 250 words:
             ]
             
             if self.verbose:
-                print(f"Running command: {' '.join(command)}")
+                shown = ["<prompt>" if arg is prompt else arg for arg in command]
+                print(f"Running command: {' '.join(shown)}")
             
             result = subprocess.run(
                 command,
+                input=prompt_input,
                 check=True,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
@@ -106,10 +363,38 @@ Please summarize the following transcript in about 250 words:
             
         except subprocess.CalledProcessError as e:
             return f"Error during summarization: {e}"
-        finally:
-            # Clean up temporary file
-            if temp_prompt_file.exists():
-                os.remove(temp_prompt_file)
+    
+    def _complete_with_server(self, port, prompt, max_length):
+        """
+        Generate a completion with a running llama.cpp server.
+        
+        Args:
+            port: Port of the server
+            prompt: Full prompt text
+            max_length: Maximum number of tokens to generate
+            
+        Returns:
+            Generated text, or an error message
+        """
+        payload = json.dumps({
+            "prompt": prompt,
+            "n_predict": max_length,
+            "temperature": 0.7,
+            "top_p": 0.9
+        }).encode("utf-8")
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{port}/completion",
+            data=payload,
+            headers={"Content-Type": "application/json"}
+        )
+        
+        try:
+            with urllib.request.urlopen(request) as response:
+                result = json.loads(response.read())
+        except (OSError, ValueError) as e:
+            return f"Error during summarization: {e}"
+        
+        return result.get("content", "").strip()
     
     def summarize_transcript(self, transcript_path):
         """
@@ -121,25 +406,25 @@ Please summarize the following transcript in about 250 words:
         Returns:
             Summary text
         """
-        if not Path(transcript_path).exists():
-            return "Error: Transcript file does not exist."
+        if self.model_type != "llama.cpp":
+            return "Unsupported model type. Currently only llama.cpp is supported."
         
-        # Read the transcript file
-        with open(transcript_path, "r") as f:
-            transcript_text = f.read()
+        # Read the transcript file; the whole text is needed since long
+        # transcripts are summarized in parts rather than truncated
+        try:
+            with open(transcript_path, "r") as f:
+                transcript_text = f.read()
+        except FileNotFoundError:
+            return "Error: Transcript file does not exist."
         
-        # Truncate if too long (many LLMs have context limits)
-        max_chars = 12000  # This assumes a 16K context window model
-        if len(transcript_text) > max_chars:
+        # Summarize in parts if the transcript does not fit in the context
+        # next to the prompt template and the generated summary
+        budget = CONTEXT_TOKENS - SUMMARY_TOKENS - PROMPT_OVERHEAD_TOKENS
+        if self._count_tokens(transcript_text) > budget:
             if self.verbose:
-                print(f"Transcript is too long ({len(transcript_text)} chars), truncating to {max_chars} chars")
-            transcript_text = transcript_text[:max_chars] + "...[truncated]"
-        
-        # Use the appropriate summarization method based on model_type
-        if self.model_type == "llama.cpp":
-            return self.summarize_with_llama_cpp(transcript_text)
-        else:
-            return "Unsupported model type. Currently only llama.cpp is supported."
+                print("Transcript does not fit in the context, summarizing it in parts")
+            return self.summarize_long(transcript_text)
+        return self.summarize_with_llama_cpp(transcript_text)
     
     def save_summary(self, transcript_path, summary_text):
         """
@@ -166,35 +451,122 @@ Please summarize the following transcript in about 250 words:
         return summary_path
 
 
+# Common extensions for LLM models
+MODEL_EXTENSIONS = (".gguf", ".bin", ".ggml")
+
+
+@functools.lru_cache(maxsize=1)
+def _models_manifest_path():
+    """
+    Locate the manifest of models found on previous runs.
+
+    Uses $XDG_CONFIG_HOME when set, ~/.config otherwise. Resolved on first
+    use rather than at import, so a missing home directory only disables
+    the manifest.
+
+    Returns:
+        Path to the manifest, or None if there is no home directory
+    """
+    base = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    if base.startswith("~"):
+        return None
+    return Path(base).absolute() / "ytscript" / "models.json"
+
+
+def _load_models_manifest():
+    """Load the models manifest, or an empty one if it is missing or invalid."""
+    manifest_path = _models_manifest_path()
+    if manifest_path is None:
+        return {}
+    try:
+        with open(manifest_path, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _save_models_manifest(manifest):
+    """Write the models manifest atomically; failures are not fatal."""
+    manifest_path = _models_manifest_path()
+    if manifest_path is None:
+        return
+    tmp_file = manifest_path.with_suffix(".json.tmp")
+    try:
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_file, manifest_path)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
 def get_available_models():
     """
     Look for available local LLM models in common locations.
     
+    The result is cached; call get_available_models.cache_clear() to
+    rescan after installing new models. Listings are also persisted in
+    the models manifest and reused while a location's mtime is unchanged, so
+    repeat runs only stat each location instead of listing it.
+    
     Returns:
-        List of model paths found
+        Tuple of model paths found
     """
-    # Common locations to check for models
+    # Common locations to check for models; those under the home
+    # directory are skipped when there is none
     locations = [
-        Path.home() / ".local/share/llama.cpp/models",
-        Path.home() / "llama.cpp/models",
-        Path.home() / "models",
-        Path.home() / ".local/share/models",
-        Path.home() / "AI/models",
-        Path("./models")
+        Path(location).expanduser()
+        for location in (
+            "~/.local/share/llama.cpp/models",
+            "~/llama.cpp/models",
+            "~/models",
+            "~/.local/share/models",
+            "~/AI/models",
+            "./models"
+        )
+        if not os.path.expanduser(location).startswith("~")
     ]
     
     found_models = []
-    
-    # Common extensions for LLM models
-    extensions = [".gguf", ".bin", ".ggml"]
+    manifest = _load_models_manifest()
+    changed = False
     
     for location in locations:
-        if location.exists():
-            for ext in extensions:
-                models = list(location.glob(f"*{ext}"))
-                found_models.extend(models)
+        key = os.path.abspath(location)
+        try:
+            mtime_ns = os.stat(key).st_mtime_ns
+        except OSError:
+            continue  # Missing location
+        
+        # Adding or removing a file updates the directory mtime, so an
+        # unchanged mtime means the recorded listing is still current
+        cached = manifest.get(key)
+        if isinstance(cached, dict) and cached.get("mtime_ns") == mtime_ns:
+            found_models.extend(Path(model) for model in cached.get("models", ()))
+            continue
+        
+        # One directory pass per location, testing all extensions at once
+        try:
+            with os.scandir(location) as entries:
+                models = sorted(
+                    Path(entry.path) for entry in entries
+                    if entry.name.endswith(MODEL_EXTENSIONS)
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                )
+        except OSError:
+            continue  # Unreadable location
+        
+        manifest[key] = {"mtime_ns": mtime_ns, "models": [str(model) for model in models]}
+        changed = True
+        found_models.extend(models)
+    
+    if changed:
+        _save_models_manifest(manifest)
     
-    return found_models
+    return tuple(found_models)
 
 
 # This allows the module to be imported or run directly
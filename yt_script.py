@@ -9,31 +9,241 @@ No internet connection is required after initial setup.
 """
 
 import argparse
+import collections
+import functools
+import hashlib
 import os
+import re
 import subprocess
 import sys
 import json
 import tempfile
+import threading
 import shutil
+import wave
+import itertools
+import socket
+import time
 from pathlib import Path
 from datetime import timedelta
 
-# Import local modules
-try:
-    from config import load_config
-except ImportError:
-    # If config.py is not found, define a simple load_config function
-    def load_config():
-        return {
-            "whisper_path": os.environ.get("WHISPER_CPP_PATH", "./whisper.cpp"),
-            "model_path": os.environ.get("WHISPER_MODEL_PATH", "./models/ggml-base.en.bin"),
-        }
+# config, urllib.request and concurrent.futures are imported where they are
+# used, so "--help" and single-video runs do not pay for loading them
+
+
+def load_config():
+    """
+    Load the configuration from config.py, or from the environment if it is missing.
+
+    Returns:
+        Object with whisper_path and model_path attributes
+    """
+    try:
+        from config import load_config as load_config_file
+    except ImportError:
+        # If config.py is not found, fall back to environment variables
+        from types import SimpleNamespace
+        return SimpleNamespace(
+            whisper_path=os.environ.get("WHISPER_CPP_PATH", "./whisper.cpp"),
+            model_path=os.environ.get("WHISPER_MODEL_PATH", "./models/ggml-base.en.bin"),
+        )
+    return load_config_file()
+
+
+# Quantized model variants, tried in this order when looking for a smaller
+# sibling of the configured model (q4_0 costs noticeable accuracy, so it is
+# only used when asked for explicitly)
+QUANTIZATIONS = ("q4_0", "q5_0", "q5_1", "q8_0")
+PREFERRED_QUANTIZATIONS = ("q5_0", "q5_1", "q8_0")
+
+# Video ID in the common YouTube URL forms, used to name streamed transcripts
+VIDEO_ID_RE = re.compile(r"(?:[?&]v=|youtu\.be/|/shorts/|/embed/|/live/)([\w-]{11})")
+
+# Audio longer than this is split across two whisper.cpp processors (seconds)
+LONG_AUDIO_SECONDS = 10 * 60
+
+# whisper.cpp server executables relative to the whisper.cpp folder, for
+# the Makefile build and for older and newer CMake builds
+WHISPER_SERVER_BINARIES = ("server", "build/bin/whisper-server", "build/bin/server")
+
+# Seconds to wait for the whisper.cpp server to load the model
+WHISPER_SERVER_TIMEOUT = 120
+
+# Concurrent downloads when transcribing several videos
+BATCH_DOWNLOADS = 4
+
+# Diagnostic lines kept from each command of a quiet pipeline for its error
+PIPELINE_ERROR_LINES = 20
+
+# CMake options that enable an accelerated whisper.cpp backend, including
+# the names used by older whisper.cpp releases
+ACCELERATION_OPTIONS = {
+    "GGML_BLAS": "BLAS", "WHISPER_OPENBLAS": "BLAS",
+    "GGML_CUDA": "CUDA", "WHISPER_CUBLAS": "CUDA", "WHISPER_CUDA": "CUDA",
+    "GGML_METAL": "Metal", "WHISPER_METAL": "Metal",
+    "GGML_VULKAN": "Vulkan", "GGML_HIP": "ROCm", "GGML_HIPBLAS": "ROCm",
+    "WHISPER_COREML": "Core ML", "WHISPER_OPENVINO": "OpenVINO",
+}
+
+# Transcripts of videos processed before, keyed by video, model and
+# language, are kept in cache_dir(); the least recently used files beyond
+# the limit are removed
+CACHE_MAX_FILES = 500
+
+
+# Model paths resolved by successful dependency checks, keyed by
+# (whisper path, model path, quantization); failures are not cached so a
+# fixed setup is picked up on the next attempt
+_verified_models = {}
+
+
+class OperationCancelled(Exception):
+    """Raised when a running download or transcription is cancelled."""
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_path(path):
+    """
+    Expand ~ and make a path absolute, caching the result.
+
+    The working directory is never changed, so relative paths keep
+    resolving to the same place for the life of the process.
+
+    Args:
+        path: Path as a string or Path
+
+    Returns:
+        Absolute Path
+    """
+    return Path(path).expanduser().absolute()
+
+
+def _forward_lines(stream, tail=None):
+    """
+    Read a binary subprocess stream line by line until it ends, then close it.
+
+    Args:
+        stream: Binary file object, e.g. a Popen stderr pipe
+        tail: collections.deque that keeps the last lines, or None to copy
+            every line to sys.stdout instead
+    """
+    with stream:
+        for line in stream:
+            line = line.decode("utf-8", errors="replace")
+            if tail is None:
+                sys.stdout.write(line)
+            elif line.strip():
+                tail.append(line.rstrip())
+
+
+@functools.lru_cache(maxsize=None)
+def cache_dir():
+    """
+    Locate the transcript cache directory.
+
+    Uses $XDG_CACHE_HOME when set, ~/.cache otherwise. Resolved on first
+    use rather than at import, so a missing home directory only disables
+    the cache.
+
+    Returns:
+        Path to the cache directory, or None if there is no home directory
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    if base.startswith("~"):
+        return None
+    return Path(base).absolute() / "ytscript"
+
+
+@functools.lru_cache(maxsize=None)
+def detect_acceleration(whisper_path):
+    """
+    Find the accelerated backends a CMake build of whisper.cpp was configured with.
+
+    Reads the build's CMakeCache.txt rather than running whisper.cpp, which
+    only reports its backends once a model is loaded.
+
+    Args:
+        whisper_path: Path to whisper.cpp main folder
+
+    Returns:
+        Sorted list of backend names (empty for a CPU-only build), or None
+        if the build configuration is unknown (e.g. a Makefile build)
+    """
+    backends = set()
+    try:
+        with open(Path(whisper_path) / "build" / "CMakeCache.txt", "r", errors="replace") as f:
+            for line in f:
+                name, sep, value = line.partition(":")
+                if name in ACCELERATION_OPTIONS and value.rpartition("=")[2].strip().upper() in ("ON", "1", "TRUE"):
+                    backends.add(ACCELERATION_OPTIONS[name])
+    except OSError:
+        return None
+    return sorted(backends)
+
+
+def advise_file(path, advice_name):
+    """
+    Give the kernel a page cache hint for a whole file, where supported.
+
+    Args:
+        path: Path to the file
+        advice_name: Name of an os.POSIX_FADV_* constant, e.g. "POSIX_FADV_WILLNEED"
+    """
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, advice)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass  # Only a hint
+
+
+def stop_process(process, timeout=3.0):
+    """
+    Terminate a subprocess, killing it if it does not exit in time.
+
+    Args:
+        process: subprocess.Popen instance to stop
+        timeout: Seconds to wait after terminating before killing
+    """
+    process.terminate()
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def format_srt_time(centiseconds):
+    """
+    Format a whisper.cpp timestamp for an SRT file.
+
+    Args:
+        centiseconds: Timestamp in units of 10 ms, as whisper.cpp reports it
+
+    Returns:
+        Timestamp formatted as HH:MM:SS,mmm
+    """
+    delta = timedelta(milliseconds=centiseconds * 10)
+    hours, remainder = divmod(int(delta.total_seconds()), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02}:{minutes:02}:{seconds:02},{delta.microseconds // 1000:03}"
 
 
 class YTScript:
     """Main class for handling YouTube transcription workflow."""
+    
+    # In-process whisper.cpp models (pywhispercpp) shared by all instances,
+    # keyed by model path, so the model is loaded once per process
+    _models = {}
+    _models_lock = threading.Lock()
 
-    def __init__(self, whisper_path, model_path, verbose=False):
+    def __init__(self, whisper_path, model_path, verbose=False, cancel_event=None, quantization=None,
+                 threads=None, processors=None, skip_verify=False, persistent=False, use_cache=True):
         """
         Initialize the YTScript with paths to required components.
 
@@ -41,49 +251,392 @@ class YTScript:
             whisper_path: Path to whisper.cpp main folder
             model_path: Path to the Whisper model file
             verbose: Whether to print verbose output
+            cancel_event: threading.Event that cancels the current operation when set
+            quantization: Quantized variant of the model to use (e.g. "q5_0"),
+                "none" for the model as given, or None to prefer a quantized
+                sibling of the model when one exists
+            threads: Total whisper.cpp threads (all but one CPU if None)
+            processors: whisper.cpp processors (2 for long audio if None)
+            skip_verify: Skip checking that yt-dlp, whisper.cpp and the model exist
+            persistent: Keep the model loaded in this process with pywhispercpp
+                (when installed) instead of running whisper.cpp for each file
+            use_cache: Reuse and store transcripts of videos processed before
+
+        Raises:
+            ValueError: If threads or processors is less than 1
         """
-        self.whisper_path = Path(whisper_path).expanduser().absolute()
-        self.model_path = Path(model_path).expanduser().absolute()
+        for name, value in (("threads", threads), ("processors", processors)):
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be at least 1, got {value}")
+        
+        self.whisper_path = _resolve_path(whisper_path)
+        self.model_path = _resolve_path(model_path)
         self.verbose = verbose
+        self.quantization = quantization
+        self.threads = threads
+        self.processors = processors
+        self.persistent = persistent
+        self.use_cache = use_cache
+        
+        # whisper.cpp server used for batches, see start_server()
+        self.server = None
+        self.server_port = None
+        
+        # Subprocesses currently running, so cancel() can stop all of them;
+        # the downloads of a batch run side by side
+        self._processes = set()
+        self._processes_lock = threading.Lock()
+        self.cancel_event = cancel_event if cancel_event is not None else threading.Event()
         
         # Verify required components exist
-        self._verify_dependencies()
+        if not skip_verify:
+            self._verify_dependencies()
 
     def _verify_dependencies(self):
-        """Verify that all required dependencies are installed and accessible."""
-        # Check if yt-dlp is installed
-        try:
-            result = subprocess.run(
-                ["yt-dlp", "--version"], 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE, 
-                text=True
-            )
-            if self.verbose:
-                print(f"Found yt-dlp: {result.stdout.strip()}")
-        except FileNotFoundError:
+        """
+        Verify that all required dependencies are installed and accessible.
+
+        The outcome is remembered for the process, so creating several
+        instances with the same paths only checks them once.
+        """
+        key = (self.whisper_path, self.model_path, self.quantization)
+        if key in _verified_models:
+            self.model_path = _verified_models[key]
+            return
+        
+        # Check if yt-dlp is installed; a PATH lookup avoids starting it
+        yt_dlp = shutil.which("yt-dlp")
+        if yt_dlp is None:
             sys.exit("Error: yt-dlp not found. Please install it using the setup script.")
+        if self.verbose:
+            print(f"Found yt-dlp: {yt_dlp}")
 
         # Check if whisper.cpp exists at the specified path
         whisper_executable = self.whisper_path / "main"
         if not whisper_executable.exists():
             sys.exit(f"Error: whisper.cpp executable not found at {whisper_executable}")
+        
+        # A CPU-only build can be several times slower than one using BLAS
+        # or a GPU; point out how to rebuild
+        if self.verbose:
+            backends = detect_acceleration(self.whisper_path)
+            if backends:
+                print(f"whisper.cpp acceleration: {', '.join(backends)}")
+            elif backends is not None:
+                print("Note: whisper.cpp was built without BLAS or GPU acceleration.")
+                print("      Rebuild it with e.g. -DGGML_BLAS=ON (OpenBLAS), -DGGML_CUDA=ON (NVIDIA)")
+                print("      or -DWHISPER_COREML=ON (Apple) for faster transcription.")
 
         # Check if the model file exists
         if not self.model_path.exists():
             sys.exit(f"Error: Whisper model not found at {self.model_path}")
+        
+        # Quantized models are about a third of the size and decode faster
+        # with little loss in accuracy, so use one when it is available
+        if self.quantization != "none":
+            self.model_path = self._find_quantized_model()
+        
+        _verified_models[key] = self.model_path
+
+    def _find_quantized_model(self):
+        """
+        Find the quantized variant of the model to use.
+
+        Looks for <stem>-<quantization>.bin next to the model file.
+
+        Returns:
+            Path to the quantized model, or the original model if none was
+            found (or the model is already quantized)
+        """
+        stem = self.model_path.stem
+        if stem.rsplit("-", 1)[-1] in QUANTIZATIONS:
+            return self.model_path
+        
+        candidates = (self.quantization,) if self.quantization else PREFERRED_QUANTIZATIONS
+        for quantization in candidates:
+            quantized = self.model_path.with_name(f"{stem}-{quantization}{self.model_path.suffix}")
+            if quantized.exists():
+                if self.verbose:
+                    print(f"Using quantized model: {quantized}")
+                return quantized
+        
+        if self.quantization:
+            sys.exit(
+                f"Error: Quantized Whisper model not found at {quantized}\n"
+                f"Create it with whisper.cpp's quantize tool:\n"
+                f"  {self.whisper_path / 'quantize'} {self.model_path} {quantized} {self.quantization}"
+            )
+        return self.model_path
+
+    @property
+    def process(self):
+        """One of the running subprocesses, or None; cancel() stops all of them."""
+        with self._processes_lock:
+            return next(iter(self._processes), None)
+
+    def _popen(self, command, **kwargs):
+        """
+        Start a subprocess that cancel() can stop.
+
+        Args:
+            command: Command and arguments to run
+            **kwargs: Passed on to subprocess.Popen
+
+        Returns:
+            subprocess.Popen instance; pass it to _forget() once it has exited
+
+        Raises:
+            OperationCancelled: If the operation was already cancelled
+        """
+        if self.cancel_event.is_set():
+            raise OperationCancelled()
+        
+        process = subprocess.Popen(command, **kwargs)
+        with self._processes_lock:
+            self._processes.add(process)
+        
+        # Cancelled before the handle was visible to cancel()
+        if self.cancel_event.is_set():
+            process.terminate()
+        return process
+
+    def _forget(self, process):
+        """Stop tracking a subprocess started with _popen()."""
+        with self._processes_lock:
+            self._processes.discard(process)
+
+    def _run_captured(self, command, cwd=None, stdout=subprocess.PIPE, stderr=None):
+        """
+        Run a command without forwarding its output, in a way cancel() can stop.
+
+        Args:
+            command: Command and arguments to run
+            cwd: Working directory for the command
+            stdout: Where stdout goes (captured and returned by default)
+            stderr: Where stderr goes (inherited by default)
+
+        Returns:
+            Captured standard output, stripped ("" if not captured)
 
-    def download_audio(self, youtube_url, output_dir=None):
+        Raises:
+            subprocess.CalledProcessError: If the command exits with an error
+            OperationCancelled: If the operation was cancelled
+        """
+        process = self._popen(command, stdout=stdout, stderr=stderr, text=True, cwd=cwd)
+        try:
+            output, errors = process.communicate()
+        finally:
+            self._forget(process)
+        
+        if self.cancel_event.is_set():
+            raise OperationCancelled()
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, command, output, errors)
+        return (output or "").strip()
+
+    def _run_streaming(self, command, cwd=None):
+        """
+        Run a command, streaming its combined stdout/stderr to sys.stdout.
+
+        Output is forwarded line by line as it arrives, so it reaches a
+        redirected sys.stdout (e.g. the GUI console) instead of the
+        process's inherited file descriptors.
+
+        Args:
+            command: Command and arguments to run
+            cwd: Working directory for the command
+
+        Returns:
+            Last non-empty line of output, without its line ending
+
+        Raises:
+            subprocess.CalledProcessError: If the command exits with an error
+            OperationCancelled: If the operation was cancelled
+        """
+        last_line = ""
+        process = self._popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=16384,
+            text=True,
+            cwd=cwd
+        )
+        try:
+            for line in process.stdout:
+                sys.stdout.write(line)
+                if line.strip():
+                    last_line = line.strip()
+            returncode = process.wait()
+        finally:
+            process.stdout.close()
+            self._forget(process)
+        
+        if self.cancel_event.is_set():
+            raise OperationCancelled()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, command)
+        return last_line
+
+    def _run_pipeline(self, commands, cwd=None):
+        """
+        Run commands connected by pipes, like a shell pipeline.
+
+        In verbose mode the last command's output and the earlier
+        commands' stderr are forwarded to sys.stdout (and so to the GUI
+        console); otherwise only their last lines are kept, and reported
+        as the stderr of the CalledProcessError if a command fails.
+
+        Args:
+            commands: List of commands, each an argument list
+            cwd: Working directory for the commands
+
+        Raises:
+            subprocess.CalledProcessError: If any command exits with an error
+            OperationCancelled: If the operation was cancelled
+        """
+        processes = []
+        forwarders = []
+        # Last diagnostic lines of each command, for the error message
+        tails = [None if self.verbose else collections.deque(maxlen=PIPELINE_ERROR_LINES) for command in commands]
+        try:
+            stdin = None
+            for command, tail in zip(commands[:-1], tails):
+                process = self._popen(
+                    command,
+                    stdin=stdin,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    cwd=cwd
+                )
+                processes.append(process)
+                # Drop the parent's copy so a failed reader breaks the pipe
+                if stdin is not None:
+                    stdin.close()
+                stdin = process.stdout
+                
+                forwarder = threading.Thread(target=_forward_lines, args=(process.stderr, tail), daemon=True)
+                forwarder.start()
+                forwarders.append(forwarder)
+            
+            last = self._popen(
+                commands[-1],
+                stdin=stdin,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=16384,
+                text=True,
+                cwd=cwd
+            )
+            processes.append(last)
+            if stdin is not None:
+                stdin.close()
+            
+            for line in last.stdout:
+                if self.verbose:
+                    sys.stdout.write(line)
+                elif line.strip():
+                    tails[-1].append(line.rstrip())
+            last.stdout.close()
+            
+            # If the last command failed, earlier ones may still be waiting
+            # on the network; stop them and report the failure that matters
+            stopped = []
+            if last.wait() != 0 or self.cancel_event.is_set():
+                stopped = [process for process in processes[:-1] if process.poll() is None]
+                for process in stopped:
+                    stop_process(process)
+            failed = [
+                (command, process.wait(), tail) for command, process, tail in zip(commands, processes, tails)
+                if process not in stopped and process.wait() != 0
+            ]
+        finally:
+            # Do not leave anything running if starting a command failed
+            for process in processes:
+                if process.poll() is None:
+                    stop_process(process)
+                self._forget(process)
+            for forwarder in forwarders:
+                forwarder.join()
+        
+        if self.cancel_event.is_set():
+            raise OperationCancelled()
+        if failed:
+            command, returncode, tail = failed[0]
+            raise subprocess.CalledProcessError(returncode, command, stderr="\n".join(tail) if tail else None)
+
+    def cancel(self, timeout=3.0):
+        """
+        Cancel the current operation, stopping all of its subprocesses.
+
+        Blocks for up to timeout seconds per subprocess while they exit.
+
+        Args:
+            timeout: Seconds to wait after terminating before killing
+        """
+        self.cancel_event.set()
+        with self._processes_lock:
+            processes = list(self._processes)
+        for process in processes:
+            stop_process(process, timeout)
+
+    def _parallelism(self, audio_path):
+        """
+        Choose the whisper.cpp thread and processor counts for a file.
+
+        Args:
+            audio_path: Path to the audio file, or None if it is streamed
+
+        Returns:
+            Tuple of (threads per processor, processors)
+        """
+        threads = self.threads
+        if threads is None:
+            # CPUs this process may run on, leaving one for the rest of the
+            # system, but never fewer than whisper.cpp's default of min(4, CPUs)
+            if hasattr(os, "sched_getaffinity"):
+                cpus = len(os.sched_getaffinity(0))
+            else:
+                cpus = os.cpu_count() or 4
+            threads = max(min(4, cpus), cpus - 1)
+        
+        processors = self.processors
+        if processors is None:
+            # Long recordings transcribe faster as two halves in parallel
+            processors = 1
+            try:
+                if audio_path is not None:
+                    with wave.open(str(audio_path), "rb") as audio:
+                        duration = audio.getnframes() / audio.getframerate()
+                    if duration > LONG_AUDIO_SECONDS and threads >= 4:
+                        processors = 2
+            except (OSError, EOFError, wave.Error):
+                pass  # Unknown duration; transcribe in one piece
+        
+        # whisper.cpp runs the given number of threads on each processor
+        return max(1, threads // processors), processors
+
+    def download_audio(self, youtube_url, output_dir=None, show_progress=None):
         """
         Download audio from a YouTube video.
 
         Args:
             youtube_url: URL of the YouTube video
             output_dir: Directory to save the audio (temp directory if None)
+            show_progress: Whether to forward yt-dlp's progress output
+                (defaults to verbose; off for concurrent downloads)
 
         Returns:
             Path to the downloaded audio file
+
+        Raises:
+            OperationCancelled: If the operation was cancelled
         """
+        if self.cancel_event.is_set():
+            raise OperationCancelled()
+        if show_progress is None:
+            show_progress = self.verbose
+        
         if self.verbose:
             print(f"Downloading audio from: {youtube_url}")
         
@@ -93,7 +646,7 @@ class YTScript:
             temp_dir = tempfile.TemporaryDirectory()
             output_dir = temp_dir.name
         else:
-            output_dir = Path(output_dir).expanduser().absolute()
+            output_dir = _resolve_path(output_dir)
             os.makedirs(output_dir, exist_ok=True)
 
         # Create a unique filename based on the video ID
@@ -102,35 +655,187 @@ class YTScript:
         # Download the audio using yt-dlp
         command = [
             "yt-dlp",
+            "--format", "bestaudio/best",  # fetch only the audio stream
             "--extract-audio",
             "--audio-format", "wav",  # wav format works well with whisper
             "--audio-quality", "0",   # highest quality
+            # whisper.cpp works on 16 kHz mono; converting here keeps the
+            # file about six times smaller than 48 kHz stereo
+            "--postprocessor-args", "ExtractAudio:-ar 16000 -ac 1",
             "--output", output_template,
-            "--quiet" if not self.verbose else "--progress",
+            # Report where the final file ended up, so no directory scan is
+            # needed to find it (this also makes yt-dlp quiet)
+            "--print", "after_move:filepath",
             youtube_url
         ]
+        if show_progress:
+            command.insert(-1, "--progress")
         
         try:
-            subprocess.run(command, check=True)
+            if show_progress:
+                output = self._run_streaming(command)
+            else:
+                output = self._run_captured(command)
+        except OperationCancelled:
+            if temp_dir:
+                temp_dir.cleanup()
+            raise
         except subprocess.CalledProcessError as e:
             if temp_dir:
                 temp_dir.cleanup()
             sys.exit(f"Error downloading video: {e}")
         
-        # Find the downloaded file
-        audio_files = list(Path(output_dir).glob("*.wav"))
-        if not audio_files:
+        # The printed path is the last line of output
+        audio_path = Path(output.splitlines()[-1]) if output else None
+        if audio_path is None or not audio_path.is_file():
             if temp_dir:
                 temp_dir.cleanup()
             sys.exit("Failed to download audio")
         
-        audio_path = audio_files[0]
         if self.verbose:
             print(f"Audio downloaded to: {audio_path}")
+            try:
+                with wave.open(str(audio_path), "rb") as audio:
+                    print(f"Audio format: {audio.getframerate()} Hz, {audio.getnchannels()} channel(s)")
+            except (OSError, EOFError, wave.Error):
+                pass
+        
+        # Start reading the audio into the page cache for whisper.cpp
+        advise_file(audio_path, "POSIX_FADV_WILLNEED")
         
         # Return the path to the audio file and the temp directory (if created)
         return audio_path, temp_dir
 
+    def _whisper_command(self, audio_path, generate_srt=False, language=None, output_base=None):
+        """
+        Build the whisper.cpp command line.
+
+        Args:
+            audio_path: Path to the audio file, or None to read WAV from stdin
+            generate_srt: Whether to generate SRT subtitle file
+            language: Language code for transcription (auto-detect if None)
+            output_base: Output path without extension (whisper.cpp's default if None)
+
+        Returns:
+            Command as an argument list
+        """
+        whisper_cmd = [
+            str(self.whisper_path / "main"),
+            "-m", str(self.model_path),
+            "-f", "-" if audio_path is None else str(audio_path),
+            "-otxt",  # Output plain text
+        ]
+        if output_base is not None:
+            whisper_cmd.extend(["-of", str(output_base)])
+        
+        # Use the available cores rather than whisper.cpp's default 4 threads
+        threads, processors = self._parallelism(audio_path)
+        whisper_cmd.extend(["-t", str(threads), "-p", str(processors)])
+        if self.verbose:
+            print(f"Using {threads} thread(s) on {processors} processor(s)")
+        
+        # Add SRT output if requested
+        if generate_srt:
+            whisper_cmd.append("-osrt")
+        
+        # Add language if specified
+        if language:
+            whisper_cmd.extend(["-l", language])
+        
+        return whisper_cmd
+
+    def _persistent_model(self):
+        """
+        Get the in-process whisper.cpp model, loading it on first use.
+
+        Returns:
+            pywhispercpp Model, or None if persistent mode is off or
+            pywhispercpp is not installed
+        """
+        if not self.persistent:
+            return None
+        
+        try:
+            from pywhispercpp.model import Model
+        except ImportError:
+            if self.verbose:
+                print("pywhispercpp is not installed; running whisper.cpp for each file")
+            return None
+        
+        key = str(self.model_path)
+        with self._models_lock:
+            model = self._models.get(key)
+            if model is None:
+                threads, processors = self._parallelism(None)
+                if self.verbose:
+                    print(f"Loading Whisper model in-process: {self.model_path}")
+                model = Model(key, n_threads=threads * processors)
+                self._models[key] = model
+        return model
+
+    @staticmethod
+    def _read_pcm(audio_path):
+        """
+        Read 16 kHz mono 16-bit WAV audio as the samples whisper.cpp expects.
+
+        pywhispercpp decodes files by running ffmpeg; the downloaded audio
+        is already in whisper.cpp's input format, so reading it directly
+        skips that extra process and decode.
+
+        Args:
+            audio_path: Path to the audio file
+
+        Returns:
+            float32 NumPy array of samples in [-1, 1), or None if the file is
+            in another format
+        """
+        try:
+            import numpy as np  # Installed with pywhispercpp
+        except ImportError:
+            return None
+        
+        try:
+            with wave.open(str(audio_path), "rb") as audio:
+                if (audio.getframerate(), audio.getnchannels(), audio.getsampwidth()) != (16000, 1, 2):
+                    return None
+                frames = audio.readframes(audio.getnframes())
+        except (OSError, EOFError, wave.Error):
+            return None
+        
+        return np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+
+    def _transcribe_in_process(self, model, audio_path, output_dir, generate_srt=False, language=None):
+        """
+        Transcribe audio with the in-process model and write the outputs.
+
+        Args:
+            model: pywhispercpp Model from _persistent_model()
+            audio_path: Path to the audio file
+            output_dir: Directory to save the transcript
+            generate_srt: Whether to generate SRT subtitle file
+            language: Language code for transcription (auto-detect if None)
+
+        Returns:
+            Tuple of paths to the output files (txt, srt if generated)
+        """
+        params = {"language": language} if language else {}
+        samples = self._read_pcm(audio_path)
+        segments = model.transcribe(str(audio_path) if samples is None else samples, **params)
+        
+        stem = Path(audio_path).stem
+        txt_output = output_dir / f"{stem}.txt"
+        with open(txt_output, "w") as f:
+            f.writelines(f"{segment.text}\n" for segment in segments)
+        
+        srt_output = None
+        if generate_srt:
+            srt_output = output_dir / f"{stem}.srt"
+            with open(srt_output, "w") as f:
+                for index, segment in enumerate(segments, 1):
+                    f.write(f"{index}\n{format_srt_time(segment.t0)} --> {format_srt_time(segment.t1)}\n{segment.text}\n\n")
+        
+        return txt_output, srt_output
+
     def transcribe(self, audio_path, output_dir=None, generate_srt=False, language=None):
         """
         Transcribe audio using whisper.cpp.
@@ -151,42 +856,48 @@ class YTScript:
         if output_dir is None:
             output_dir = Path(audio_path).parent
         else:
-            output_dir = Path(output_dir).expanduser().absolute()
+            output_dir = _resolve_path(output_dir)
             os.makedirs(output_dir, exist_ok=True)
         
         # Base output filename (without extension)
         base_output = output_dir / Path(audio_path).stem
         
-        # Prepare whisper.cpp command
-        whisper_cmd = [
-            str(self.whisper_path / "main"),
-            "-m", str(self.model_path),
-            "-f", str(audio_path),
-            "-otxt",  # Output plain text
-        ]
-        
-        # Add SRT output if requested
-        if generate_srt:
-            whisper_cmd.append("-osrt")
+        # Reuse the model kept loaded in this process when there is one
+        model = self._persistent_model()
+        if model is not None:
+            txt_output, srt_output = self._transcribe_in_process(model, audio_path, output_dir, generate_srt, language)
+            if self.verbose:
+                print(f"Transcription complete.")
+                print(f"Text transcript: {txt_output}")
+                if generate_srt:
+                    print(f"SRT subtitle file: {srt_output}")
+            return txt_output, srt_output
         
-        # Add language if specified
-        if language:
-            whisper_cmd.extend(["-l", language])
+        # Prepare whisper.cpp command
+        whisper_cmd = self._whisper_command(audio_path, generate_srt, language)
         
         if self.verbose:
             print(f"Running whisper.cpp command: {' '.join(whisper_cmd)}")
         
         try:
-            result = subprocess.run(
-                whisper_cmd,
-                check=True,
-                stdout=subprocess.PIPE if not self.verbose else None,
-                stderr=subprocess.PIPE if not self.verbose else None,
-                cwd=str(output_dir)
-            )
+            if self.verbose:
+                self._run_streaming(whisper_cmd, cwd=str(output_dir))
+            else:
+                # The transcript is also printed to stdout; it is written
+                # to the output files anyway, so do not buffer it here
+                self._run_captured(
+                    whisper_cmd,
+                    cwd=str(output_dir),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE
+                )
         except subprocess.CalledProcessError as e:
             sys.exit(f"Error during transcription: {e}")
         
+        # The audio has been read once and is not needed again; release its
+        # cached pages now rather than when memory runs short
+        advise_file(audio_path, "POSIX_FADV_DONTNEED")
+        
         # Whisper.cpp saves output files in the current working directory
         txt_output = output_dir / f"{Path(audio_path).stem}.txt"
         srt_output = output_dir / f"{Path(audio_path).stem}.srt" if generate_srt else None
@@ -199,6 +910,173 @@ class YTScript:
         
         return txt_output, srt_output
 
+    def process_video_streamed(self, youtube_url, output_dir=None, generate_srt=False, language=None):
+        """
+        Download and transcribe a YouTube video without writing the audio to disk.
+
+        The audio is piped from yt-dlp through ffmpeg (converting it to the
+        16 kHz mono WAV whisper.cpp expects) straight into whisper.cpp, so
+        decoding overlaps the download and no intermediate file is written.
+
+        Args:
+            youtube_url: URL of the YouTube video
+            output_dir: Directory to save the outputs (current directory if None)
+            generate_srt: Whether to generate SRT subtitle file
+            language: Language code for transcription
+
+        Returns:
+            Tuple of paths to the output files (txt, srt if generated)
+        """
+        if self.verbose:
+            print(f"Streaming audio from: {youtube_url}")
+        
+        output_dir = _resolve_path(output_dir or os.getcwd())
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # Name the outputs after the video ID, as the download path does;
+        # without one, use a unique name so transcripts do not overwrite
+        # each other
+        match = VIDEO_ID_RE.search(youtube_url)
+        if match:
+            base_output = output_dir / match.group(1)
+        else:
+            import uuid
+            base_output = output_dir / f"transcript-{uuid.uuid4().hex[:8]}"
+        
+        commands = [
+            ["yt-dlp", "--format", "bestaudio/best", "--quiet", "--output", "-", youtube_url],
+            ["ffmpeg", "-loglevel", "error", "-i", "pipe:0", "-ac", "1", "-ar", "16000", "-f", "wav", "pipe:1"],
+            self._whisper_command(None, generate_srt, language, output_base=base_output),
+        ]
+        
+        if self.verbose:
+            print(f"Running pipeline: {' | '.join(' '.join(command) for command in commands)}")
+        
+        try:
+            self._run_pipeline(commands, cwd=str(output_dir))
+        except subprocess.CalledProcessError as e:
+            # Without verbose output the command's own message is all that
+            # explains the failure (a private video, a model that fails to load)
+            if e.stderr:
+                sys.exit(f"Error during transcription: {e}\n{e.stderr}")
+            sys.exit(f"Error during transcription: {e}")
+        
+        txt_output = base_output.with_name(base_output.name + ".txt")
+        srt_output = base_output.with_name(base_output.name + ".srt") if generate_srt else None
+        
+        if self.verbose:
+            print(f"Transcription complete.")
+            print(f"Text transcript: {txt_output}")
+            if generate_srt:
+                print(f"SRT subtitle file: {srt_output}")
+        
+        return txt_output, srt_output
+
+    def _cache_key(self, youtube_url, language):
+        """
+        Build the transcript cache key for a video.
+
+        The model is identified by its size and modification time, which
+        changes whenever the file is replaced, without hashing the file.
+
+        Args:
+            youtube_url: URL of the YouTube video
+            language: Language code for transcription
+
+        Returns:
+            Tuple of (video ID, cache key), or None if caching is disabled or
+            unavailable, the URL has no recognisable video ID or the model
+            cannot be read
+        """
+        if not self.use_cache or cache_dir() is None:
+            return None
+        match = VIDEO_ID_RE.search(youtube_url)
+        if not match:
+            return None
+        try:
+            stat = self.model_path.stat()
+        except OSError:
+            return None
+        
+        video_id = match.group(1)
+        key_text = f"{video_id}|{stat.st_size}-{stat.st_mtime_ns}|{language}"
+        return video_id, hashlib.blake2b(key_text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cached_result(self, youtube_url, output_dir, generate_srt=False, language=None):
+        """
+        Copy a cached transcript of a video to the output directory.
+
+        Args:
+            youtube_url: URL of the YouTube video
+            output_dir: Directory to save the outputs
+            generate_srt: Whether an SRT subtitle file is needed
+            language: Language code for transcription
+
+        Returns:
+            Tuple of paths to the output files (txt, srt if generated), or
+            None if the video is not cached
+        """
+        cache_key = self._cache_key(youtube_url, language)
+        if cache_key is None:
+            return None
+        video_id, key = cache_key
+        
+        cached_txt = cache_dir() / f"{key}.txt"
+        cached_srt = cache_dir() / f"{key}.srt"
+        if not cached_txt.is_file() or (generate_srt and not cached_srt.is_file()):
+            return None
+        
+        output_dir = _resolve_path(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
+        txt_path = output_dir / f"{video_id}.txt"
+        srt_path = output_dir / f"{video_id}.srt" if generate_srt else None
+        try:
+            shutil.copyfile(cached_txt, txt_path)
+            os.utime(cached_txt)  # Mark as recently used
+            if generate_srt:
+                shutil.copyfile(cached_srt, srt_path)
+                os.utime(cached_srt)
+        except OSError:
+            return None
+        
+        if self.verbose:
+            print(f"Using cached transcript for video {video_id}")
+        return txt_path, srt_path
+
+    def _store_result(self, youtube_url, language, txt_path, srt_path):
+        """
+        Add a finished transcript to the cache; failures are not fatal.
+
+        Args:
+            youtube_url: URL of the YouTube video
+            language: Language code used for transcription
+            txt_path: Path to the text transcript
+            srt_path: Path to the SRT subtitle file, or None
+        """
+        cache_key = self._cache_key(youtube_url, language)
+        if cache_key is None:
+            return
+        key = cache_key[1]
+        directory = cache_dir()
+        
+        try:
+            os.makedirs(directory, exist_ok=True)
+            for path, suffix in ((txt_path, ".txt"), (srt_path, ".srt")):
+                if path is not None and Path(path).is_file():
+                    tmp_file = directory / f"{key}{suffix}.tmp"
+                    shutil.copyfile(path, tmp_file)
+                    os.replace(tmp_file, directory / f"{key}{suffix}")
+            
+            # Drop the least recently used files beyond the limit
+            with os.scandir(directory) as entries:
+                files = [(entry.stat().st_mtime, entry.path) for entry in entries if entry.is_file()]
+            files.sort()
+            for mtime, path in files[:max(0, len(files) - CACHE_MAX_FILES)]:
+                os.remove(path)
+        except OSError as e:
+            if self.verbose:
+                print(f"Could not cache transcript: {e}")
+
     def process_video(self, youtube_url, output_dir=None, generate_srt=False, language=None, keep_audio=False):
         """
         Process a YouTube video: download and transcribe.
@@ -216,9 +1094,22 @@ class YTScript:
         if self.verbose:
             print(f"Processing video: {youtube_url}")
         
+        # Reuse the transcript from an earlier run (there is no audio to keep)
+        if output_dir and not keep_audio:
+            cached = self._cached_result(youtube_url, output_dir, generate_srt, language)
+            if cached is not None:
+                return cached
+        
+        # Without an audio file to keep, stream the audio instead of
+        # downloading it first
+        if not keep_audio and self._persistent_model() is None and shutil.which("ffmpeg"):
+            txt_path, srt_path = self.process_video_streamed(youtube_url, output_dir, generate_srt, language)
+            self._store_result(youtube_url, language, txt_path, srt_path)
+            return txt_path, srt_path
+        
         # Create output directory if specified
         if output_dir:
-            output_dir = Path(output_dir).expanduser().absolute()
+            output_dir = _resolve_path(output_dir)
             os.makedirs(output_dir, exist_ok=True)
         
         # Download audio
@@ -241,14 +1132,16 @@ class YTScript:
                 
             # If we're using a temp directory but want to keep the outputs,
             # move them to the output directory
+            # (a rename unless the temp directory is on another filesystem)
             if temp_dir and output_dir:
                 if txt_path.exists():
-                    shutil.copy(txt_path, output_dir)
+                    shutil.move(str(txt_path), str(output_dir / txt_path.name))
                     txt_path = output_dir / txt_path.name
                 if srt_path and srt_path.exists():
-                    shutil.copy(srt_path, output_dir)
+                    shutil.move(str(srt_path), str(output_dir / srt_path.name))
                     srt_path = output_dir / srt_path.name
             
+            self._store_result(youtube_url, language, txt_path, srt_path)
             return txt_path, srt_path
             
         finally:
@@ -257,6 +1150,245 @@ class YTScript:
                 temp_dir.cleanup()
 
 
+    def start_server(self):
+        """
+        Start a whisper.cpp server that keeps the model loaded.
+
+        Returns:
+            Port the server listens on, or None if no server executable was found
+
+        Raises:
+            RuntimeError: If the server does not start
+        """
+        candidates = (self.whisper_path / name for name in WHISPER_SERVER_BINARIES)
+        server_path = next((path for path in candidates if path.exists()), None)
+        if server_path is None:
+            return None
+        
+        # Let the OS pick a free port
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        
+        threads, processors = self._parallelism(None)
+        command = [
+            str(server_path),
+            "-m", str(self.model_path),
+            "-t", str(threads),
+            "--host", "127.0.0.1",
+            "--port", str(port)
+        ]
+        if self.verbose:
+            print(f"Starting whisper.cpp server: {' '.join(command)}")
+        
+        self.server = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.server_port = port
+        
+        # The server only listens once the model is loaded
+        deadline = time.monotonic() + WHISPER_SERVER_TIMEOUT
+        while True:
+            returncode = self.server.poll()
+            if returncode is not None:
+                self.server = None
+                raise RuntimeError(f"whisper.cpp server exited with code {returncode}")
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                return port
+            except OSError:
+                pass
+            if time.monotonic() > deadline:
+                self.stop_server()
+                raise RuntimeError("whisper.cpp server did not start in time")
+            time.sleep(0.25)
+
+    def stop_server(self):
+        """Stop the whisper.cpp server if one is running."""
+        server, self.server = self.server, None
+        if server is not None:
+            stop_process(server)
+
+    def transcribe_with_server(self, audio_path, output_dir=None, generate_srt=False, language=None):
+        """
+        Transcribe audio with the running whisper.cpp server.
+
+        Args:
+            audio_path: Path to the audio file
+            output_dir: Directory to save the transcript (next to the audio if None)
+            generate_srt: Whether to generate SRT subtitle file
+            language: Language code for transcription (server default if None)
+
+        Returns:
+            Tuple of paths to the output files (txt, srt if generated)
+        """
+        if self.verbose:
+            print(f"Transcribing audio file with the server: {audio_path}")
+        
+        output_dir = _resolve_path(output_dir or Path(audio_path).parent)
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # Ask for SRT when subtitles are wanted; the plain text is the
+        # subtitle text, so one request produces both files
+        fields = {"response_format": "srt" if generate_srt else "text"}
+        if language:
+            fields["language"] = language
+        
+        import uuid
+        import urllib.request
+        
+        # Build a multipart/form-data body with the fields and the audio
+        boundary = uuid.uuid4().hex
+        parts = []
+        for name, value in fields.items():
+            parts.append(
+                f"--{boundary}\r\nContent-Disposition: form-data; name=\"{name}\"\r\n\r\n{value}\r\n".encode("utf-8")
+            )
+        parts.append(
+            f"--{boundary}\r\nContent-Disposition: form-data; name=\"file\"; "
+            f"filename=\"{Path(audio_path).name}\"\r\nContent-Type: audio/wav\r\n\r\n".encode("utf-8")
+        )
+        with open(audio_path, "rb") as f:
+            parts.append(f.read())
+        parts.append(f"\r\n--{boundary}--\r\n".encode("utf-8"))
+        
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{self.server_port}/inference",
+            data=b"".join(parts),
+            headers={"Content-Type": f"multipart/form-data; boundary={boundary}"}
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                result = response.read().decode("utf-8")
+        except OSError as e:
+            sys.exit(f"Error during transcription: {e}")
+        
+        stem = Path(audio_path).stem
+        txt_output = output_dir / f"{stem}.txt"
+        srt_output = None
+        if generate_srt:
+            srt_output = output_dir / f"{stem}.srt"
+            with open(srt_output, "w") as f:
+                f.write(result)
+            # Keep the text lines of each block, dropping indices and timestamps
+            lines = []
+            for block in result.strip().split("\n\n"):
+                block_lines = block.strip().splitlines()
+                lines.append(" ".join(block_lines[2:]))
+            result = "\n".join(lines) + "\n"
+        with open(txt_output, "w") as f:
+            f.write(result)
+        
+        if self.verbose:
+            print(f"Text transcript: {txt_output}")
+            if generate_srt:
+                print(f"SRT subtitle file: {srt_output}")
+        
+        return txt_output, srt_output
+
+    def process_videos(self, youtube_urls, output_dir=None, generate_srt=False, language=None, keep_audio=False):
+        """
+        Process several YouTube videos, loading the model only once.
+
+        Audio is downloaded concurrently while the videos that are ready
+        are transcribed, so network and CPU work overlap. Transcription
+        uses a whisper.cpp server when one is available and whisper.cpp
+        (or the in-process model) for each file otherwise.
+
+        Args:
+            youtube_urls: URLs of the YouTube videos
+            output_dir: Directory to save the outputs (current directory if None)
+            generate_srt: Whether to generate SRT subtitle files
+            language: Language code for transcription
+            keep_audio: Whether to keep the downloaded audio files
+
+        Returns:
+            List of (txt, srt) path tuples in the order of youtube_urls; a
+            video that failed has None in its place
+        """
+        output_dir = _resolve_path(output_dir or os.getcwd())
+        results = [None] * len(youtube_urls)
+        
+        # Videos transcribed on earlier runs need neither download nor server
+        pending = []
+        for index, youtube_url in enumerate(youtube_urls):
+            if not keep_audio:
+                results[index] = self._cached_result(youtube_url, output_dir, generate_srt, language)
+            if results[index] is None:
+                pending.append(index)
+        if not pending:
+            return results
+        
+        try:
+            port = self.start_server()
+        except RuntimeError as e:
+            print(f"Warning: {e}; loading the model for each video")
+            port = None
+        transcribe = self.transcribe if port is None else self.transcribe_with_server
+        
+        import concurrent.futures
+        
+        # Each video downloads into its own temporary directory, removed
+        # as soon as that video is transcribed; downloads run side by side,
+        # so their progress output is not forwarded
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=BATCH_DOWNLOADS)
+        futures = {}
+        handled = set()
+        try:
+            for index in pending:
+                future = executor.submit(self.download_audio, youtube_urls[index], show_progress=False)
+                futures[future] = index
+            for future in concurrent.futures.as_completed(futures):
+                index = futures[future]
+                handled.add(index)
+                try:
+                    audio_path, temp_dir = future.result()
+                except OperationCancelled:
+                    raise
+                except (SystemExit, Exception) as e:
+                    print(f"Skipping {youtube_urls[index]}: {e}")
+                    continue
+                try:
+                    results[index] = transcribe(audio_path, output_dir, generate_srt, language)
+                    self._store_result(youtube_urls[index], language, *results[index])
+                    if keep_audio:
+                        shutil.move(str(audio_path), str(output_dir / audio_path.name))
+                except OperationCancelled:
+                    raise
+                except (SystemExit, Exception) as e:
+                    results[index] = None
+                    print(f"Skipping {youtube_urls[index]}: {e}")
+                finally:
+                    temp_dir.cleanup()
+        except BaseException:
+            # Stop the running downloads and drop the queued ones rather
+            # than finishing them (shutdown(cancel_futures=True) needs 3.9)
+            self.cancel_event.set()
+            for future in futures:
+                future.cancel()
+            self.cancel()
+            raise
+        finally:
+            executor.shutdown(wait=True)
+            # Downloads that finished but were never transcribed
+            for future, index in futures.items():
+                if index in handled or future.cancelled() or future.exception() is not None:
+                    continue
+                future.result()[1].cleanup()
+            self.stop_server()
+        
+        return results
+
+
+def _positive_int(value):
+    """Parse a command line count that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def parse_arguments():
     """Parse command line arguments."""
     # Load configuration
@@ -269,7 +1401,8 @@ def parse_arguments():
     
     parser.add_argument(
         "url",
-        help="YouTube video URL to transcribe"
+        nargs="+",
+        help="YouTube video URL(s) to transcribe"
     )
     
     parser.add_argument(
@@ -281,13 +1414,45 @@ def parse_arguments():
     parser.add_argument(
         "--whisper-path",
         help="Path to whisper.cpp directory",
-        default=config["whisper_path"]
+        default=config.whisper_path
     )
     
     parser.add_argument(
         "--model-path",
         help="Path to Whisper model file",
-        default=config["model_path"]
+        default=config.model_path
+    )
+    
+    parser.add_argument(
+        "--quantization",
+        choices=QUANTIZATIONS + ("none",),
+        help="Quantized variant of the model to use; by default a quantized "
+             "copy next to the model is used when one exists"
+    )
+    
+    parser.add_argument(
+        "--threads",
+        type=_positive_int,
+        help="Total number of whisper.cpp threads (default: all CPUs but one)"
+    )
+    
+    parser.add_argument(
+        "--processors",
+        type=_positive_int,
+        help="Number of whisper.cpp processors (default: 2 for audio over 10 minutes, otherwise 1)"
+    )
+    
+    parser.add_argument(
+        "--persistent",
+        action="store_true",
+        help="Keep the Whisper model loaded in-process with pywhispercpp "
+             "(if installed) instead of running whisper.cpp for each video"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Transcribe again even if a cached transcript exists, and do not cache the result"
     )
     
     parser.add_argument(
@@ -340,50 +1505,15 @@ def parse_arguments():
     return parser.parse_args()
 
 
-def main():
-    """Main entry point for the script."""
-    args = parse_arguments()
-    
-    # If setup flag is provided, run the setup script
-    if args.setup:
-        setup_script = Path(__file__).parent / "setup.py"
-        if setup_script.exists():
-            subprocess.run([sys.executable, str(setup_script)])
-        else:
-            sys.exit(f"Setup script not found at: {setup_script}")
-        return
-    
-    # If list-llms flag is provided, list available LLMs and exit
-    if args.list_llms:
-        try:
-            from summarizer import get_available_models
-            models = get_available_models()
-            if models:
-                print("Found the following LLM models:")
-                for i, model in enumerate(models, 1):
-                    print(f"{i}. {model}")
-            else:
-                print("No LLM models found in common locations.")
-        except ImportError:
-            print("Error: summarizer module not found. Ensure summarizer.py is in the same directory.")
-        return
-    
-    # Initialize YTScript
-    transcriber = YTScript(
-        whisper_path=args.whisper_path,
-        model_path=args.model_path,
-        verbose=args.verbose
-    )
-    
-    # Process the video
-    txt_path, srt_path = transcriber.process_video(
-        youtube_url=args.url,
-        output_dir=args.output_dir,
-        generate_srt=args.srt,
-        language=args.language,
-        keep_audio=args.keep_audio
-    )
-    
+def report_transcript(args, txt_path, srt_path):
+    """
+    Print where a transcript was saved and a preview, and summarize it if requested.
+
+    Args:
+        args: Parsed command line arguments
+        txt_path: Path to the text transcript
+        srt_path: Path to the SRT subtitle file, or None
+    """
     print("\nTranscription complete!")
     print(f"Text transcript saved to: {txt_path}")
     if srt_path:
@@ -392,7 +1522,7 @@ def main():
     # Print first few lines of the transcript
     if txt_path.exists():
         with open(txt_path, 'r') as f:
-            preview = "".join(f.readlines()[:5])
+            preview = "".join(itertools.islice(f, 5))
             print("\nTranscript preview:")
             print("-" * 40)
             print(preview + "...")
@@ -428,5 +1558,68 @@ def main():
             print("Continuing without summarization.")
 
 
+
+def main():
+    """Main entry point for the script."""
+    args = parse_arguments()
+    
+    # If setup flag is provided, run the setup script
+    if args.setup:
+        setup_script = Path(__file__).parent / "setup.py"
+        if setup_script.exists():
+            subprocess.run([sys.executable, str(setup_script)])
+        else:
+            sys.exit(f"Setup script not found at: {setup_script}")
+        return
+    
+    # If list-llms flag is provided, list available LLMs and exit
+    if args.list_llms:
+        try:
+            from summarizer import get_available_models
+            models = get_available_models()
+            if models:
+                print("Found the following LLM models:")
+                for i, model in enumerate(models, 1):
+                    print(f"{i}. {model}")
+            else:
+                print("No LLM models found in common locations.")
+        except ImportError:
+            print("Error: summarizer module not found. Ensure summarizer.py is in the same directory.")
+        return
+    
+    # Initialize YTScript
+    transcriber = YTScript(
+        whisper_path=args.whisper_path,
+        model_path=args.model_path,
+        verbose=args.verbose,
+        quantization=args.quantization,
+        threads=args.threads,
+        processors=args.processors,
+        persistent=args.persistent,
+        use_cache=not args.no_cache
+    )
+    
+    # Process the videos; several URLs share one loaded model
+    if len(args.url) > 1:
+        results = transcriber.process_videos(
+            youtube_urls=args.url,
+            output_dir=args.output_dir,
+            generate_srt=args.srt,
+            language=args.language,
+            keep_audio=args.keep_audio
+        )
+    else:
+        results = [transcriber.process_video(
+            youtube_url=args.url[0],
+            output_dir=args.output_dir,
+            generate_srt=args.srt,
+            language=args.language,
+            keep_audio=args.keep_audio
+        )]
+    
+    for result in results:
+        if result is not None:
+            report_transcript(args, *result)
+
 if __name__ == "__main__":
     main()
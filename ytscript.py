@@ -11,9 +11,7 @@ Usage:
 """
 
 import sys
-import os
 import argparse
-from pathlib import Path
 
 
 def main():
@@ -32,14 +30,12 @@ def main():
     # Parse only the GUI flag
     args, remaining_args = parser.parse_known_args()
     
-    # Determine script directory
-    script_dir = Path(__file__).parent
-    
+    # The script's directory is already first on sys.path, so the other
+    # modules import directly
     if args.gui:
         # Launch GUI mode
         try:
             # Import the GUI module and run it
-            sys.path.insert(0, str(script_dir))
             from gui import main as gui_main
             gui_main()
         except ImportError as e:
@@ -47,14 +43,14 @@ def main():
             print("Make sure the GUI prerequisites are installed.")
             sys.exit(1)
     else:
-        # Launch CLI mode by calling yt_script.py
-        cli_script = script_dir / "yt_script.py"
-        if not cli_script.exists():
-            print(f"Error: CLI script not found at {cli_script}")
+        # Launch CLI mode in this process rather than starting a second
+        # interpreter; it parses the same command line arguments
+        try:
+            from yt_script import main as cli_main
+        except ImportError as e:
+            print(f"Error: Failed to import CLI module: {e}")
             sys.exit(1)
-        
-        # Replace current process with the CLI script
-        os.execv(sys.executable, [sys.executable, str(cli_script)] + sys.argv[1:])
+        cli_main()
 
 
 if __name__ == "__main__":